@@ -6,6 +6,8 @@ Implements retry logic, normalized symbols, and structured logging.
 """
 
 import logging
+import threading
+import time
 from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import Any
@@ -27,6 +29,9 @@ class DataProvider(ABC):
     from various sources (Yahoo Finance, Stooq, AlphaVantage, etc.).
     """
 
+    # Whether fetch_ohlcv_batch downloads all tickers in one provider request
+    batch_download = False
+
     @abstractmethod
     def fetch_ohlcv(
         self,
@@ -54,6 +59,21 @@ class DataProvider(ABC):
             RuntimeError: If data fetch fails after retries
         """
 
+    def fetch_ohlcv_batch(
+        self,
+        tickers: list[str],
+        start_date: datetime,
+        end_date: datetime,
+        interval: str = "1d",
+    ) -> dict[str, pd.DataFrame]:
+        """
+        Fetch OHLCV data for several tickers at once.
+
+        Providers that set batch_download override this to download every ticker
+        in a single request; the default falls back to fetch_ohlcv.
+        """
+        return self.fetch_ohlcv(tickers, start_date, end_date, interval)
+
     @abstractmethod
     def fetch_fundamentals(self, ticker: str) -> dict[str, Any]:
         """
@@ -92,6 +112,8 @@ class YahooDataProvider(DataProvider):
     Supports US markets (NYSE, NASDAQ) and Euronext.
     """
 
+    batch_download = True
+
     def __init__(self):
         """Initialize Yahoo Finance data provider."""
         self.source_name = "Yahoo Finance"
@@ -186,6 +208,93 @@ class YahooDataProvider(DataProvider):
 
         return result
 
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=10),
+        reraise=True,
+    )
+    def fetch_ohlcv_batch(
+        self,
+        tickers: list[str],
+        start_date: datetime,
+        end_date: datetime,
+        interval: str = "1d",
+    ) -> dict[str, pd.DataFrame]:
+        """
+        Fetch OHLCV data for all tickers with a single yfinance download.
+
+        Tickers without data are logged and left out of the result. Unlike
+        fetch_ohlcv, a download that returns nothing for any ticker is retried and
+        then raised, so throttling and network failures reach the caller.
+        """
+        if not tickers:
+            raise ValueError("Tickers list cannot be empty")
+
+        if start_date >= end_date:
+            raise ValueError("start_date must be before end_date")
+
+        logger.info(
+            "Fetching OHLCV data in one request",
+            extra={
+                "source": self.source_name,
+                "tickers": tickers,
+                "start": start_date.isoformat(),
+                "end": end_date.isoformat(),
+                "interval": interval,
+            },
+        )
+
+        data = yf.download(
+            tickers,
+            start=start_date,
+            end=end_date,
+            interval=interval,
+            group_by="ticker",
+            progress=False,
+            auto_adjust=True,  # Adjust for splits and dividends
+        )
+
+        result = {}
+        available = (
+            set(data.columns.get_level_values(0))
+            if isinstance(data.columns, pd.MultiIndex)
+            else set()
+        )
+        for ticker in tickers:
+            if ticker not in available:
+                ticker_data = pd.DataFrame()
+            else:
+                # Tickers missing from a shared index come back as all-NaN rows
+                ticker_data = data[ticker][["Open", "High", "Low", "Close", "Volume"]].dropna(
+                    how="all"
+                )
+
+            if ticker_data.empty:
+                logger.warning(
+                    "No data returned",
+                    extra={"source": self.source_name, "ticker": ticker},
+                )
+                continue
+
+            if not isinstance(ticker_data.index, pd.DatetimeIndex):
+                ticker_data.index = pd.to_datetime(ticker_data.index)
+
+            result[ticker] = ticker_data
+
+        if not result:
+            raise RuntimeError(f"No data returned for any of {len(tickers)} tickers")
+
+        logger.info(
+            "Successfully fetched data",
+            extra={
+                "source": self.source_name,
+                "tickers": list(result),
+                "rows": sum(len(df) for df in result.values()),
+            },
+        )
+
+        return result
+
     def fetch_fundamentals(self, ticker: str) -> dict[str, Any]:
         """
         Fetch fundamental data from Yahoo Finance.
@@ -421,6 +530,109 @@ class StooqDataProvider(DataProvider):
         return symbol
 
 
+class RateLimiter:
+    """Thread-safe limiter spacing provider requests evenly across worker threads."""
+
+    def __init__(self, requests_per_second: float):
+        self.interval = 1.0 / requests_per_second if requests_per_second > 0 else 0.0
+        self._next_slot = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until the next request slot is available."""
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.interval
+        if wait > 0:
+            time.sleep(wait)
+
+
+def fetch_ohlcv_rate_limited(
+    provider: DataProvider,
+    tickers: list[str],
+    start_date: datetime,
+    end_date: datetime,
+    rate_limiter: RateLimiter,
+    interval: str = "1d",
+) -> tuple[dict[str, pd.DataFrame], dict[str, str]]:
+    """
+    Fetch OHLCV data taking one rate limiter slot per provider request.
+
+    Providers with batch_download get all tickers in a single request; the others
+    download symbol by symbol, so each symbol is its own request.
+
+    Returns:
+        Tuple of (non-empty data by ticker, error message by ticker for failed requests)
+    """
+    if provider.batch_download:
+        rate_limiter.acquire()
+        try:
+            fetched = provider.fetch_ohlcv_batch(
+                tickers=tickers,
+                start_date=start_date,
+                end_date=end_date,
+                interval=interval,
+            )
+        except Exception as e:
+            return {}, {ticker: str(e) for ticker in tickers}
+        return {ticker: df for ticker, df in fetched.items() if not df.empty}, {}
+
+    data: dict[str, pd.DataFrame] = {}
+    errors: dict[str, str] = {}
+    for ticker in tickers:
+        rate_limiter.acquire()
+        try:
+            fetched = provider.fetch_ohlcv(
+                tickers=[ticker],
+                start_date=start_date,
+                end_date=end_date,
+                interval=interval,
+            )
+        except Exception as e:
+            errors[ticker] = str(e)
+            continue
+        if ticker in fetched and not fetched[ticker].empty:
+            data[ticker] = fetched[ticker]
+    return data, errors
+
+
+class RateLimitedProvider:
+    """
+    Wrap a provider so every request it makes takes a slot from a shared limiter.
+
+    Batch-download providers fetch all tickers in one request, the others one symbol
+    per request. Failed symbols are logged and left out of the result; when nothing
+    could be fetched, such as a throttled batch download, the first error is raised
+    so callers still see quota failures.
+    """
+
+    def __init__(self, provider: DataProvider, rate_limiter: RateLimiter):
+        self.provider = provider
+        self.source_name = provider.source_name
+        self.rate_limiter = rate_limiter
+
+    def fetch_ohlcv(
+        self,
+        tickers: list[str],
+        start_date: datetime,
+        end_date: datetime,
+        interval: str = "1d",
+    ) -> dict[str, pd.DataFrame]:
+        """Fetch OHLCV data at the limiter's pace."""
+        data, errors = fetch_ohlcv_rate_limited(
+            self.provider, tickers, start_date, end_date, self.rate_limiter, interval
+        )
+        for ticker, error in errors.items():
+            logger.warning(
+                "Failed to fetch data",
+                extra={"source": self.source_name, "ticker": ticker, "error": error},
+            )
+        if errors and not data:
+            raise RuntimeError(next(iter(errors.values())))
+        return data
+
+
 def create_data_provider_with_fallback() -> tuple[DataProvider, DataProvider | None]:
     """
     Factory function to create primary and fallback data providers.
@@ -0,0 +1,91 @@
+"""
+Bulk loading of OHLCV price bars with PostgreSQL COPY.
+
+Shared by the daily and intraday seeding scripts.
+"""
+
+import io
+from collections import Counter
+from datetime import UTC
+from typing import Any
+
+import pandas as pd
+from sqlmodel import Session
+
+# Columns streamed through COPY, in CSV order
+PRICE_BAR_COPY_COLUMNS = "instrument_id, ts, o, h, l, c, v, interval"
+
+
+def copy_price_bars_batch(
+    session: Session,
+    frames: dict[Any, pd.DataFrame],
+    interval: str = "daily",
+) -> dict[Any, tuple[int, int]]:
+    """
+    Bulk load price bars for a whole batch of instruments with PostgreSQL COPY.
+
+    Rows are streamed as CSV into a temporary staging table, then moved into
+    price_bars with INSERT ... SELECT ... ON CONFLICT DO NOTHING, so the unique
+    (instrument_id, ts, interval) index drops bars that already exist.
+
+    Args:
+        session: Database session (committed by the caller)
+        frames: OHLCV DataFrames keyed by instrument id
+        interval: Bar interval stored with every row
+
+    Returns:
+        Dict mapping instrument id to (inserted_count, skipped_count)
+    """
+    frames = {instrument_id: df for instrument_id, df in frames.items() if not df.empty}
+    if not frames:
+        return {}
+
+    # Serialize the batch column-wise; timestamps are written as naive UTC to match
+    # the timestamp column
+    parts = []
+    for instrument_id, df in frames.items():
+        index = df.index.tz_localize(UTC) if df.index.tz is None else df.index.tz_convert(UTC)
+        parts.append(
+            pd.DataFrame(
+                {
+                    "instrument_id": str(instrument_id),
+                    "ts": index.tz_localize(None),
+                    "o": df["Open"].to_numpy(dtype=float),
+                    "h": df["High"].to_numpy(dtype=float),
+                    "l": df["Low"].to_numpy(dtype=float),
+                    "c": df["Close"].to_numpy(dtype=float),
+                    "v": df["Volume"].to_numpy(dtype=float),
+                    "interval": interval,
+                }
+            )
+        )
+    # Missing values are written as NaN, which the float columns accept, rather
+    # than as empty fields that COPY would load as NULL into NOT NULL columns
+    buffer = io.StringIO()
+    pd.concat(parts, ignore_index=True).to_csv(buffer, header=False, index=False, na_rep="NaN")
+
+    connection = session.connection()
+    connection.exec_driver_sql(
+        "CREATE TEMP TABLE IF NOT EXISTS price_bars_staging ON COMMIT DELETE ROWS AS "
+        f"SELECT {PRICE_BAR_COPY_COLUMNS} FROM price_bars WITH NO DATA"
+    )
+
+    copy_sql = f"COPY price_bars_staging ({PRICE_BAR_COPY_COLUMNS}) FROM STDIN WITH (FORMAT csv)"
+    with connection.connection.cursor() as cursor, cursor.copy(copy_sql) as copy:
+        copy.write(buffer.getvalue())
+
+    result = connection.exec_driver_sql(
+        f"INSERT INTO price_bars (id, {PRICE_BAR_COPY_COLUMNS}, created_at) "
+        f"SELECT gen_random_uuid(), {PRICE_BAR_COPY_COLUMNS}, NOW() AT TIME ZONE 'UTC' "
+        "FROM price_bars_staging "
+        "ON CONFLICT (instrument_id, ts, interval) DO NOTHING "
+        "RETURNING instrument_id"
+    )
+    inserted_by_instrument = Counter(str(instrument_id) for instrument_id in result.scalars())
+    connection.exec_driver_sql("TRUNCATE price_bars_staging")
+
+    counts = {}
+    for instrument_id, df in frames.items():
+        inserted = inserted_by_instrument[str(instrument_id)]
+        counts[instrument_id] = (inserted, len(df) - inserted)
+    return counts
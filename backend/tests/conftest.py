@@ -0,0 +1,15 @@
+"""
+Shared pytest configuration for backend tests.
+
+Makes the repository root importable so tests can load the seeding scripts
+(e.g. ``scripts.seed_prices``). Lives here rather than in individual test
+modules so every pytest-xdist worker picks it up.
+"""
+
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).parent.parent.parent
+
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
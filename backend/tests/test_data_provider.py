@@ -6,7 +6,7 @@ implementations with proper mocking to avoid actual API calls.
 """
 
 from datetime import UTC, datetime
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
 import pandas as pd
 import pytest
@@ -14,6 +14,8 @@ import requests
 
 from app.data_provider import (
     DataProvider,
+    RateLimitedProvider,
+    RateLimiter,
     StooqDataProvider,
     YahooDataProvider,
     create_data_provider_with_fallback,
@@ -80,9 +82,9 @@ class TestYahooDataProvider:
         provider = YahooDataProvider()
         assert provider.normalize_symbol("ASML", "EURONEXT_AMSTERDAM") == "ASML.AS"
 
-    @patch("app.data_provider.yf.download")
-    def test_fetch_ohlcv_success_single_ticker(self, mock_download):
+    def test_fetch_ohlcv_success_single_ticker(self, mocker):
         """Fetch OHLCV for single ticker successfully."""
+        mock_download = mocker.patch("app.data_provider.yf.download")
         # Create mock DataFrame
         dates = pd.date_range("2024-01-01", periods=5, freq="D")
         mock_data = pd.DataFrame(
@@ -108,9 +110,9 @@ class TestYahooDataProvider:
         assert list(result["AAPL"].columns) == ["Open", "High", "Low", "Close", "Volume"]
         assert isinstance(result["AAPL"].index, pd.DatetimeIndex)
 
-    @patch("app.data_provider.yf.download")
-    def test_fetch_ohlcv_success_multiple_tickers(self, mock_download):
+    def test_fetch_ohlcv_success_multiple_tickers(self, mocker):
         """Fetch OHLCV for multiple tickers."""
+        mock_download = mocker.patch("app.data_provider.yf.download")
         dates = pd.date_range("2024-01-01", periods=3, freq="D")
 
         def mock_download_func(ticker, **kwargs):  # noqa: ARG001
@@ -141,9 +143,9 @@ class TestYahooDataProvider:
         assert result["AAPL"]["Close"].iloc[0] == 100.5
         assert result["MSFT"]["Close"].iloc[0] == 200.5
 
-    @patch("app.data_provider.yf.download")
-    def test_fetch_ohlcv_empty_data(self, mock_download):
+    def test_fetch_ohlcv_empty_data(self, mocker):
         """Handle empty data response gracefully."""
+        mock_download = mocker.patch("app.data_provider.yf.download")
         mock_download.return_value = pd.DataFrame()
 
         provider = YahooDataProvider()
@@ -173,9 +175,55 @@ class TestYahooDataProvider:
                 utc_datetime(2024, 1, 1),
             )
 
-    @patch("app.data_provider.yf.Ticker")
-    def test_fetch_fundamentals_success(self, mock_ticker_class):
+    def test_fetch_ohlcv_batch_single_request(self, mocker):
+        """Download all tickers in one call and split the grouped frame per ticker."""
+        mock_download = mocker.patch("app.data_provider.yf.download")
+        dates = pd.date_range("2024-01-01", periods=2, freq="D")
+        columns = pd.MultiIndex.from_product(
+            [["AAPL", "DELISTED"], ["Close", "High", "Low", "Open", "Volume"]]
+        )
+        mock_download.return_value = pd.DataFrame(
+            [
+                [100.5, 101.0, 99.0, 100.0, 1000, None, None, None, None, None],
+                [101.5, 102.0, 100.0, 101.0, 1100, None, None, None, None, None],
+            ],
+            index=dates,
+            columns=columns,
+        )
+
+        provider = YahooDataProvider()
+        result = provider.fetch_ohlcv_batch(
+            ["AAPL", "DELISTED", "MISSING"],
+            utc_datetime(2024, 1, 1),
+            utc_datetime(2024, 1, 3),
+        )
+
+        mock_download.assert_called_once()
+        assert mock_download.call_args.args[0] == ["AAPL", "DELISTED", "MISSING"]
+        assert mock_download.call_args.kwargs["group_by"] == "ticker"
+        assert list(result) == ["AAPL"]
+        assert list(result["AAPL"].columns) == ["Open", "High", "Low", "Close", "Volume"]
+        assert result["AAPL"]["Close"].tolist() == [100.5, 101.5]
+
+    def test_fetch_ohlcv_batch_raises_when_nothing_returned(self, mocker):
+        """Raise after retries when the download returns no data for any ticker."""
+        mock_download = mocker.patch("app.data_provider.yf.download")
+        mock_download.return_value = pd.DataFrame()
+        mocker.patch.object(YahooDataProvider.fetch_ohlcv_batch.retry, "sleep")
+
+        provider = YahooDataProvider()
+        with pytest.raises(RuntimeError, match="No data returned for any of 2 tickers"):
+            provider.fetch_ohlcv_batch(
+                ["AAPL", "MSFT"],
+                utc_datetime(2024, 1, 1),
+                utc_datetime(2024, 1, 3),
+            )
+
+        assert mock_download.call_count == 3
+
+    def test_fetch_fundamentals_success(self, mocker):
         """Fetch fundamentals successfully."""
+        mock_ticker_class = mocker.patch("app.data_provider.yf.Ticker")
         mock_ticker = Mock()
         mock_ticker.info = {
             "longName": "Apple Inc.",
@@ -199,9 +247,9 @@ class TestYahooDataProvider:
         assert result["exchange"] == "NASDAQ"
         assert result["currency"] == "USD"
 
-    @patch("app.data_provider.yf.Ticker")
-    def test_fetch_fundamentals_partial_data(self, mock_ticker_class):
+    def test_fetch_fundamentals_partial_data(self, mocker):
         """Handle partial fundamental data gracefully."""
+        mock_ticker_class = mocker.patch("app.data_provider.yf.Ticker")
         mock_ticker = Mock()
         mock_ticker.info = {
             "shortName": "Apple",
@@ -225,9 +273,9 @@ class TestYahooDataProvider:
         with pytest.raises(ValueError, match="Ticker cannot be empty"):
             provider.fetch_fundamentals("")
 
-    @patch("app.data_provider.yf.Ticker")
-    def test_fetch_fundamentals_api_error(self, mock_ticker_class):
+    def test_fetch_fundamentals_api_error(self, mocker):
         """Handle API errors when fetching fundamentals."""
+        mock_ticker_class = mocker.patch("app.data_provider.yf.Ticker")
         mock_ticker_class.side_effect = Exception("API Error")
 
         provider = YahooDataProvider()
@@ -256,9 +304,9 @@ class TestStooqDataProvider:
         provider = StooqDataProvider()
         assert provider.normalize_symbol("MC", "EURONEXT") == "MC"
 
-    @patch("app.data_provider.requests.get")
-    def test_fetch_ohlcv_success(self, mock_get):
+    def test_fetch_ohlcv_success(self, mocker):
         """Fetch OHLCV successfully from Stooq."""
+        mock_get = mocker.patch("app.data_provider.requests.get")
         csv_data = """Date,Open,High,Low,Close,Volume
 2024-01-01,100.0,101.0,99.0,100.5,1000000
 2024-01-02,101.0,102.0,100.0,101.5,1100000
@@ -281,9 +329,9 @@ class TestStooqDataProvider:
         assert list(result["AAPL"].columns) == ["Open", "High", "Low", "Close", "Volume"]
         assert result["AAPL"]["Close"].iloc[0] == 100.5
 
-    @patch("app.data_provider.requests.get")
-    def test_fetch_ohlcv_empty_response(self, mock_get):
+    def test_fetch_ohlcv_empty_response(self, mocker):
         """Handle empty response from Stooq."""
+        mock_get = mocker.patch("app.data_provider.requests.get")
         mock_response = Mock()
         mock_response.text = "Date,Open,High,Low,Close,Volume\n"
         mock_response.raise_for_status = Mock()
@@ -298,9 +346,9 @@ class TestStooqDataProvider:
 
         assert result == {}
 
-    @patch("app.data_provider.requests.get")
-    def test_fetch_ohlcv_http_error(self, mock_get):
+    def test_fetch_ohlcv_http_error(self, mocker):
         """Handle HTTP errors gracefully."""
+        mock_get = mocker.patch("app.data_provider.requests.get")
         mock_get.side_effect = requests.exceptions.RequestException("Network error")
 
         provider = StooqDataProvider()
@@ -356,12 +404,88 @@ class TestCreateDataProviderWithFallback:
         assert fallback.source_name == "Stooq"
 
 
+class TestRateLimitedProvider:
+    """Test rate limiting of provider fetches."""
+
+    def _frame(self):
+        return pd.DataFrame(
+            {"Open": [1.0], "High": [1.0], "Low": [1.0], "Close": [1.0], "Volume": [1]},
+            index=pd.date_range("2024-01-01", periods=1),
+        )
+
+    def test_one_limiter_slot_per_symbol(self):
+        """Each symbol is fetched in its own call after taking a limiter slot."""
+        provider = Mock(source_name="Test", batch_download=False)
+        provider.fetch_ohlcv.side_effect = lambda tickers, **_: {tickers[0]: self._frame()}
+        rate_limiter = Mock(spec=RateLimiter)
+
+        limited = RateLimitedProvider(provider, rate_limiter)
+        result = limited.fetch_ohlcv(
+            ["AAA", "BBB"], utc_datetime(2024, 1, 1), utc_datetime(2024, 1, 2), "15m"
+        )
+
+        assert set(result) == {"AAA", "BBB"}
+        assert rate_limiter.acquire.call_count == 2
+        assert [c.kwargs["tickers"] for c in provider.fetch_ohlcv.call_args_list] == [
+            ["AAA"],
+            ["BBB"],
+        ]
+        assert provider.fetch_ohlcv.call_args.kwargs["interval"] == "15m"
+
+    def test_one_limiter_slot_per_batch_request(self):
+        """Batch-download providers get every symbol in one call and one slot."""
+        provider = Mock(source_name="Test", batch_download=True)
+        provider.fetch_ohlcv_batch.return_value = {"AAA": self._frame()}
+        rate_limiter = Mock(spec=RateLimiter)
+
+        limited = RateLimitedProvider(provider, rate_limiter)
+        result = limited.fetch_ohlcv(
+            ["AAA", "BBB"], utc_datetime(2024, 1, 1), utc_datetime(2024, 1, 2), "15m"
+        )
+
+        assert list(result) == ["AAA"]
+        assert rate_limiter.acquire.call_count == 1
+        provider.fetch_ohlcv_batch.assert_called_once()
+        assert provider.fetch_ohlcv_batch.call_args.kwargs["tickers"] == ["AAA", "BBB"]
+        provider.fetch_ohlcv.assert_not_called()
+
+    def test_partial_failure_drops_symbol(self):
+        """A failed symbol is left out while the others are returned."""
+        provider = Mock(source_name="Test", batch_download=False)
+        provider.fetch_ohlcv.side_effect = [Exception("boom"), {"BBB": self._frame()}]
+
+        limited = RateLimitedProvider(provider, RateLimiter(0))
+        result = limited.fetch_ohlcv(
+            ["AAA", "BBB"], utc_datetime(2024, 1, 1), utc_datetime(2024, 1, 2)
+        )
+
+        assert list(result) == ["BBB"]
+
+    def test_raises_when_batch_download_fails(self):
+        """A failed batch download is raised instead of returning no data."""
+        provider = Mock(source_name="Test", batch_download=True)
+        provider.fetch_ohlcv_batch.side_effect = RuntimeError("Too Many Requests")
+
+        limited = RateLimitedProvider(provider, RateLimiter(0))
+        with pytest.raises(RuntimeError, match="Too Many Requests"):
+            limited.fetch_ohlcv(["AAA", "BBB"], utc_datetime(2024, 1, 1), utc_datetime(2024, 1, 2))
+
+    def test_raises_when_every_symbol_fails(self):
+        """The first error is raised when no symbol could be fetched."""
+        provider = Mock(source_name="Test", batch_download=False)
+        provider.fetch_ohlcv.side_effect = Exception("rate limit exceeded")
+
+        limited = RateLimitedProvider(provider, RateLimiter(0))
+        with pytest.raises(RuntimeError, match="rate limit exceeded"):
+            limited.fetch_ohlcv(["AAA", "BBB"], utc_datetime(2024, 1, 1), utc_datetime(2024, 1, 2))
+
+
 class TestRetryLogic:
     """Test retry logic for providers."""
 
-    @patch("app.data_provider.yf.download")
-    def test_yahoo_retry_on_failure(self, mock_download):
+    def test_yahoo_retry_on_failure(self, mocker):
         """Yahoo provider retries on failure."""
+        mock_download = mocker.patch("app.data_provider.yf.download")
         # Fail twice, succeed on third attempt
         mock_download.side_effect = [
             Exception("Temporary error"),
@@ -389,9 +513,9 @@ class TestRetryLogic:
         assert "AAPL" in result
         assert mock_download.call_count == 3
 
-    @patch("app.data_provider.yf.download")
-    def test_yahoo_fails_after_max_retries(self, mock_download):
+    def test_yahoo_fails_after_max_retries(self, mocker):
         """Yahoo provider fails after max retries."""
+        mock_download = mocker.patch("app.data_provider.yf.download")
         mock_download.side_effect = Exception("Persistent error")
 
         provider = YahooDataProvider()
@@ -5,7 +5,6 @@ Tests the intraday seeding script and 15m interval support.
 """
 
 from datetime import UTC, datetime, timedelta
-from unittest.mock import patch
 
 import pandas as pd
 import pytest
@@ -21,9 +20,9 @@ def utc_datetime(*args):
 class TestIntradayDataProvider:
     """Test intraday 15m interval support."""
 
-    @patch("app.data_provider.yf.download")
-    def test_fetch_ohlcv_15m_interval(self, mock_download):
+    def test_fetch_ohlcv_15m_interval(self, mocker):
         """Fetch OHLCV with 15m interval successfully."""
+        mock_download = mocker.patch("app.data_provider.yf.download")
         # Create mock 15m data (26 bars per day for market hours)
         dates = pd.date_range(
             "2024-01-02 09:30:00", periods=26, freq="15min", tz="America/New_York"
@@ -52,9 +51,9 @@ class TestIntradayDataProvider:
         assert len(result["AAPL"]) == 26
         assert list(result["AAPL"].columns) == ["Open", "High", "Low", "Close", "Volume"]
 
-    @patch("app.data_provider.yf.download")
-    def test_fetch_ohlcv_15m_multiple_days(self, mock_download):
+    def test_fetch_ohlcv_15m_multiple_days(self, mocker):
         """Fetch 15m data for multiple days."""
+        mock_download = mocker.patch("app.data_provider.yf.download")
         # Create 3 days of 15m data (78 bars)
         dates = pd.date_range(
             "2024-01-02 09:30:00", periods=78, freq="15min", tz="America/New_York"
@@ -82,9 +81,9 @@ class TestIntradayDataProvider:
         assert "MSFT" in result
         assert len(result["MSFT"]) == 78
 
-    @patch("app.data_provider.yf.download")
-    def test_fetch_ohlcv_15m_rolling_30_days(self, mock_download):
+    def test_fetch_ohlcv_15m_rolling_30_days(self, mocker):
         """Fetch 15m data for rolling 30-day window."""
+        mock_download = mocker.patch("app.data_provider.yf.download")
         # Approximate 30 days * 26 bars/day = 780 bars
         num_bars = 780
         dates = pd.date_range(
@@ -120,9 +119,9 @@ class TestIntradayDataProvider:
         expected_cols = ["Open", "High", "Low", "Close", "Volume"]
         assert all(col in result["GOOGL"].columns for col in expected_cols)
 
-    @patch("app.data_provider.yf.download")
-    def test_fetch_ohlcv_15m_empty_data(self, mock_download):
+    def test_fetch_ohlcv_15m_empty_data(self, mocker):
         """Handle empty data for 15m interval gracefully."""
+        mock_download = mocker.patch("app.data_provider.yf.download")
         mock_download.return_value = pd.DataFrame()
 
         provider = YahooDataProvider()
@@ -136,9 +135,9 @@ class TestIntradayDataProvider:
         # Should return empty dict, ticker not included
         assert "INVALID" not in result
 
-    @patch("app.data_provider.yf.download")
-    def test_fetch_ohlcv_15m_batch_tickers(self, mock_download):
+    def test_fetch_ohlcv_15m_batch_tickers(self, mocker):
         """Fetch 15m data for multiple tickers in batch."""
+        mock_download = mocker.patch("app.data_provider.yf.download")
         def mock_download_side_effect(ticker, start, end, interval, progress, auto_adjust):  # noqa: ARG001
             dates = pd.date_range(
                 "2024-01-02 09:30:00", periods=26, freq="15min", tz="America/New_York"
@@ -170,9 +169,9 @@ class TestIntradayDataProvider:
             assert ticker in result
             assert len(result[ticker]) == 26
 
-    @patch("app.data_provider.yf.download")
-    def test_fetch_ohlcv_15m_partial_failure(self, mock_download):
+    def test_fetch_ohlcv_15m_partial_failure(self, mocker):
         """Continue processing other tickers when one fails."""
+        mock_download = mocker.patch("app.data_provider.yf.download")
         call_count = [0]
         
         def mock_download_side_effect(ticker, start, end, interval, progress, auto_adjust):  # noqa: ARG001
@@ -234,9 +233,9 @@ class TestIntradayDataProvider:
                 interval="15m",
             )
 
-    @patch("app.data_provider.yf.download")
-    def test_fetch_ohlcv_supports_various_intervals(self, mock_download):
+    def test_fetch_ohlcv_supports_various_intervals(self, mocker):
         """Test that provider supports various intervals including 15m."""
+        mock_download = mocker.patch("app.data_provider.yf.download")
         dates_daily = pd.date_range("2024-01-01", periods=5, freq="D")
         dates_15m = pd.date_range(
             "2024-01-01 09:30:00", periods=26, freq="15min", tz="America/New_York"
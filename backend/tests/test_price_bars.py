@@ -0,0 +1,87 @@
+"""
+Tests for the shared PostgreSQL COPY loader for price bars.
+"""
+
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pandas as pd
+from sqlmodel import Session
+
+from app.price_bars import copy_price_bars_batch
+
+
+class TestCopyPriceBarsBatch:
+    """Test bulk loading through the COPY staging table (mocked database)."""
+
+    def test_empty_frames_skip_database(self):
+        """Test bulk load with nothing to load skips the database."""
+        mock_session = MagicMock(spec=Session)
+
+        counts = copy_price_bars_batch(mock_session, {uuid4(): pd.DataFrame()})
+
+        assert counts == {}
+        mock_session.connection.assert_not_called()
+
+    def test_streams_csv_and_counts_conflicts(self):
+        """Test bulk load streams CSV through COPY and counts conflicts as skipped."""
+        mock_session = MagicMock(spec=Session)
+        connection = mock_session.connection.return_value
+        cursor = connection.connection.cursor.return_value.__enter__.return_value
+        copy = cursor.copy.return_value.__enter__.return_value
+
+        dates = pd.date_range("2024-01-01", periods=3, freq="D")
+        df = pd.DataFrame(
+            {
+                "Open": [100.0, 101.0, 102.0],
+                "High": [105.0, 106.0, 107.0],
+                "Low": [95.0, 96.0, 97.0],
+                "Close": [102.0, 103.0, 104.0],
+                "Volume": [1000000, 1100000, 1200000],
+            },
+            index=dates,
+        )
+        first_id, second_id = uuid4(), uuid4()
+
+        # All rows of the first instrument come back, one of the second conflicts
+        insert_result = MagicMock()
+        insert_result.scalars.return_value = [first_id] * 3 + [second_id] * 2
+        connection.exec_driver_sql.side_effect = [MagicMock(), insert_result, MagicMock()]
+
+        counts = copy_price_bars_batch(mock_session, {first_id: df, second_id: df}, "daily")
+
+        assert counts == {first_id: (3, 0), second_id: (2, 1)}
+        mock_session.commit.assert_not_called()
+        assert "COPY price_bars_staging" in cursor.copy.call_args.args[0]
+
+        rows = copy.write.call_args.args[0].splitlines()
+        assert len(rows) == 6
+        assert rows[0] == f"{first_id},2024-01-01,100.0,105.0,95.0,102.0,1000000.0,daily"
+
+        insert_sql = connection.exec_driver_sql.call_args_list[1].args[0]
+        assert "ON CONFLICT (instrument_id, ts, interval) DO NOTHING" in insert_sql
+
+    def test_writes_nan_not_null(self):
+        """Test missing values are streamed as NaN rather than empty (NULL) fields."""
+        mock_session = MagicMock(spec=Session)
+        connection = mock_session.connection.return_value
+        cursor = connection.connection.cursor.return_value.__enter__.return_value
+        copy = cursor.copy.return_value.__enter__.return_value
+        instrument_id = uuid4()
+        connection.exec_driver_sql.return_value.scalars.return_value = [instrument_id]
+
+        df = pd.DataFrame(
+            {
+                "Open": [100.0],
+                "High": [105.0],
+                "Low": [95.0],
+                "Close": [102.0],
+                "Volume": [float("nan")],
+            },
+            index=pd.date_range("2024-01-01", periods=1, freq="D"),
+        )
+
+        copy_price_bars_batch(mock_session, {instrument_id: df}, "daily")
+
+        row = copy.write.call_args.args[0].strip()
+        assert row == f"{instrument_id},2024-01-01,100.0,105.0,95.0,102.0,NaN,daily"
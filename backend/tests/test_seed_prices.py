@@ -8,26 +8,24 @@ Validates key functionality including:
 - Error handling
 """
 
-import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 from uuid import uuid4
 
 import pandas as pd
 import pytest
-from sqlmodel import Session, select
-
-# Add scripts directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from scripts.seed_prices import (
     TICKER_LIST,
+    RateLimiter,
     SeedProgress,
     check_existing_data,
     get_or_create_instrument,
-    insert_price_bars_bulk,
+    load_instrument_cache,
+    seed_batch,
 )
+from sqlmodel import Session, select
 
 from app.models import Instrument, PriceBar
 
@@ -89,28 +87,84 @@ class TestSeedProgress:
         progress.total_tickers = 10
         progress.processed_tickers = 5
 
-        checkpoint_file = tmp_path / "test_checkpoint.json"
-        progress.save_checkpoint(str(checkpoint_file))
+        checkpoint_file = tmp_path / "test_checkpoint.jsonl"
+        progress.save_checkpoint(str(checkpoint_file), batch_idx=0)
 
         assert checkpoint_file.exists()
 
         import json
 
         with open(checkpoint_file) as f:
-            data = json.load(f)
+            data = json.loads(f.readline())
 
         assert "progress" in data
         assert "errors" in data
         assert "timestamp" in data
+        assert data["batch_idx"] == 0
         assert data["progress"]["total_tickers"] == 10
 
+    def test_save_checkpoint_appends_new_errors_only(self, tmp_path):
+        """Test each checkpoint line carries only errors since the previous one."""
+        import json
+
+        progress = SeedProgress()
+        checkpoint_file = tmp_path / "test_checkpoint.jsonl"
+
+        progress.errors.append({"ticker": "AAA", "error": "boom"})
+        progress.save_checkpoint(str(checkpoint_file), batch_idx=0)
+        progress.errors.append({"ticker": "BBB", "error": "boom"})
+        progress.save_checkpoint(str(checkpoint_file), batch_idx=1)
+
+        with open(checkpoint_file) as f:
+            lines = [json.loads(line) for line in f]
+
+        assert len(lines) == 2
+        assert [e["ticker"] for e in lines[0]["errors"]] == ["AAA"]
+        assert [e["ticker"] for e in lines[1]["errors"]] == ["BBB"]
+
+    def test_save_checkpoint_tags_lines_with_run(self, tmp_path):
+        """Test lines from separate runs appended to one file can be told apart."""
+        import json
+
+        checkpoint_file = tmp_path / "test_checkpoint.jsonl"
+        first_run = SeedProgress()
+        first_run.save_checkpoint(str(checkpoint_file), batch_idx=0)
+        second_run = SeedProgress()
+        second_run.start_time = first_run.start_time + timedelta(hours=1)
+        second_run.save_checkpoint(str(checkpoint_file), batch_idx=0)
+
+        with open(checkpoint_file) as f:
+            lines = [json.loads(line) for line in f]
+
+        assert [line["run_started_at"] for line in lines] == [
+            first_run.start_time.isoformat(),
+            second_run.start_time.isoformat(),
+        ]
+
+    def test_save_final_state(self, tmp_path):
+        """Test final state contains every recorded error."""
+        import json
+
+        progress = SeedProgress()
+        progress.errors.append({"ticker": "AAA", "error": "boom"})
+        progress.save_checkpoint(str(tmp_path / "test_checkpoint.jsonl"))
+        progress.errors.append({"ticker": "BBB", "error": "boom"})
+
+        state_file = tmp_path / "test_final_state.json"
+        progress.save_final_state(str(state_file))
+
+        with open(state_file) as f:
+            data = json.load(f)
+
+        assert [e["ticker"] for e in data["errors"]] == ["AAA", "BBB"]
+
 
 class TestDatabaseOperations:
     """Test database operations (mocked)."""
 
-    @patch("scripts.seed_prices.Session")
-    def test_get_or_create_instrument_creates_new(self, mock_session_class):
+    def test_get_or_create_instrument_creates_new(self, mocker):
         """Test instrument creation when it doesn't exist."""
+        mocker.patch("scripts.seed_prices.Session")
         # Setup mock
         mock_session = MagicMock(spec=Session)
         mock_exec = MagicMock()
@@ -124,11 +178,12 @@ class TestDatabaseOperations:
         assert instrument.symbol == "TEST"
         assert instrument.exchange == "NASDAQ"
         mock_session.add.assert_called_once()
-        mock_session.commit.assert_called_once()
+        mock_session.flush.assert_called_once()
+        mock_session.commit.assert_not_called()
 
-    @patch("scripts.seed_prices.Session")
-    def test_get_or_create_instrument_returns_existing(self, mock_session_class):
+    def test_get_or_create_instrument_returns_existing(self, mocker):
         """Test instrument retrieval when it exists."""
+        mocker.patch("scripts.seed_prices.Session")
         # Setup mock
         existing_instrument = Instrument(
             id=uuid4(), symbol="TEST", exchange="NASDAQ", is_active=True
@@ -146,50 +201,173 @@ class TestDatabaseOperations:
         assert instrument.symbol == "TEST"
         mock_session.add.assert_not_called()
 
-    def test_insert_price_bars_bulk_with_empty_dataframe(self):
-        """Test bulk insert with empty DataFrame."""
+    def test_load_instrument_cache(self):
+        """Test instrument ids are resolved with a single query keyed by symbol."""
+        aapl_id, msft_id = uuid4(), uuid4()
         mock_session = MagicMock(spec=Session)
-        df = pd.DataFrame()
+        mock_exec = MagicMock()
+        mock_exec.all.return_value = [("AAPL", aapl_id), ("MSFT", msft_id)]
+        mock_session.exec.return_value = mock_exec
 
-        inserted, skipped = insert_price_bars_bulk(
-            mock_session, uuid4(), df, "daily"
-        )
+        cache = load_instrument_cache(mock_session, ["AAPL", "MSFT", "GOOGL"])
 
-        assert inserted == 0
-        assert skipped == 0
-        mock_session.add_all.assert_not_called()
+        assert cache == {"AAPL": aapl_id, "MSFT": msft_id}
+        mock_session.exec.assert_called_once()
 
-    def test_insert_price_bars_bulk_with_data(self):
-        """Test bulk insert with actual data."""
+    def test_check_existing_data_returns_count(self):
+        """Test existing bar count comes from a single COUNT query."""
         mock_session = MagicMock(spec=Session)
-
-        # Mock existing data query to return empty list
         mock_exec = MagicMock()
-        mock_exec.all.return_value = []
+        mock_exec.one.return_value = 1500
         mock_session.exec.return_value = mock_exec
 
-        # Create sample DataFrame
-        dates = pd.date_range("2024-01-01", periods=5, freq="D")
-        df = pd.DataFrame(
+        count = check_existing_data(mock_session, uuid4(), datetime.now(UTC))
+
+        assert count == 1500
+        mock_session.exec.assert_called_once()
+        mock_exec.all.assert_not_called()
+
+
+class TestSeedBatch:
+    """Test concurrent batch seeding (mocked providers and database)."""
+
+    @staticmethod
+    def _make_df():
+        dates = pd.date_range("2024-01-01", periods=3, freq="D")
+        return pd.DataFrame(
             {
-                "Open": [100.0, 101.0, 102.0, 103.0, 104.0],
-                "High": [105.0, 106.0, 107.0, 108.0, 109.0],
-                "Low": [95.0, 96.0, 97.0, 98.0, 99.0],
-                "Close": [102.0, 103.0, 104.0, 105.0, 106.0],
-                "Volume": [1000000, 1100000, 1200000, 1300000, 1400000],
+                "Open": [100.0, 101.0, 102.0],
+                "High": [105.0, 106.0, 107.0],
+                "Low": [95.0, 96.0, 97.0],
+                "Close": [102.0, 103.0, 104.0],
+                "Volume": [1000000, 1100000, 1200000],
             },
             index=dates,
         )
 
-        instrument_id = uuid4()
-        inserted, skipped = insert_price_bars_bulk(
-            mock_session, instrument_id, df, "daily"
+    def test_seed_batch_uses_fallback_and_keeps_order(self, mocker):
+        """Test chunked multi-ticker fetches, fallback for misses, results in order."""
+        mocker.patch(
+            "scripts.seed_prices.get_or_create_instrument",
+            side_effect=lambda _, symbol: Instrument(id=uuid4(), symbol=symbol, exchange="NASDAQ"),
+        )
+        mocker.patch("scripts.seed_prices.check_existing_data", return_value=0)
+        mock_copy = mocker.patch(
+            "scripts.seed_prices.copy_price_bars_batch",
+            side_effect=lambda _, frames: dict.fromkeys(frames, (3, 0)),
         )
 
-        assert inserted == 5
-        assert skipped == 0
-        mock_session.add_all.assert_called_once()
-        mock_session.commit.assert_called_once()
+        primary = MagicMock(batch_download=True)
+        primary.fetch_ohlcv_batch.side_effect = lambda tickers, **_: {
+            ticker: self._make_df() for ticker in tickers if ticker != "BBB"
+        }
+        fallback = MagicMock(batch_download=False)
+        fallback.fetch_ohlcv.return_value = {}
+
+        rate_limiter = MagicMock(spec=RateLimiter)
+
+        progress = SeedProgress()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = seed_batch(
+                session=MagicMock(spec=Session),
+                executor=executor,
+                tickers=["AAA", "BBB", "CCC"],
+                start_date=datetime(2024, 1, 1, tzinfo=UTC),
+                end_date=datetime(2024, 1, 4, tzinfo=UTC),
+                primary_provider=primary,
+                fallback_provider=fallback,
+                rate_limiter=rate_limiter,
+                instrument_cache={},
+                progress=progress,
+                fetch_chunk_size=2,
+            )
+
+        assert results == [True, False, True]
+        mock_copy.assert_called_once()
+        assert len(mock_copy.call_args.args[1]) == 2
+        assert sorted(c.kwargs["tickers"] for c in primary.fetch_ohlcv_batch.call_args_list) == [
+            ["AAA", "BBB"],
+            ["CCC"],
+        ]
+        primary.fetch_ohlcv.assert_not_called()
+        # One limiter slot per provider request, fallback included
+        assert rate_limiter.acquire.call_count == 3
+        fallback.fetch_ohlcv.assert_called_once()
+        assert fallback.fetch_ohlcv.call_args.kwargs["tickers"] == ["BBB"]
+        assert progress.total_bars_inserted == 6
+        assert [e["ticker"] for e in progress.errors] == ["BBB"]
+
+    def test_seed_batch_reuses_cached_instruments(self, mocker):
+        """Test cached instruments skip the get-or-create lookup."""
+        mock_get_or_create = mocker.patch("scripts.seed_prices.get_or_create_instrument")
+        mocker.patch("scripts.seed_prices.check_existing_data", return_value=10_000)
+
+        cached = uuid4()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            results = seed_batch(
+                session=MagicMock(spec=Session),
+                executor=executor,
+                tickers=["AAA"],
+                start_date=datetime(2024, 1, 1, tzinfo=UTC),
+                end_date=datetime(2024, 1, 4, tzinfo=UTC),
+                primary_provider=MagicMock(),
+                fallback_provider=MagicMock(),
+                rate_limiter=RateLimiter(0),
+                instrument_cache={"AAA": cached},
+                progress=SeedProgress(),
+            )
+
+        assert results == [True]
+        mock_get_or_create.assert_not_called()
+
+    def test_seed_batch_failed_existing_check_reports_failure(self, mocker):
+        """Test a ticker whose existing-data check raises is reported as failed."""
+        mocker.patch("scripts.seed_prices.check_existing_data", side_effect=Exception("db down"))
+        primary = MagicMock(batch_download=True)
+
+        progress = SeedProgress()
+        cached = uuid4()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            results = seed_batch(
+                session=MagicMock(spec=Session),
+                executor=executor,
+                tickers=["AAA"],
+                start_date=datetime(2024, 1, 1, tzinfo=UTC),
+                end_date=datetime(2024, 1, 4, tzinfo=UTC),
+                primary_provider=primary,
+                fallback_provider=MagicMock(),
+                rate_limiter=RateLimiter(0),
+                instrument_cache={"AAA": cached},
+                progress=progress,
+            )
+
+        assert results == [False]
+        assert [e["error"] for e in progress.errors] == ["db down"]
+        primary.fetch_ohlcv_batch.assert_not_called()
+
+    def test_seed_batch_sufficiency_scales_with_years(self, mocker):
+        """Test the existing-data threshold follows the requested number of years."""
+        mocker.patch("scripts.seed_prices.check_existing_data", return_value=250)
+
+        cached = uuid4()
+        primary = MagicMock(batch_download=True)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            results = seed_batch(
+                session=MagicMock(spec=Session),
+                executor=executor,
+                tickers=["AAA"],
+                start_date=datetime(2023, 1, 1, tzinfo=UTC),
+                end_date=datetime(2024, 1, 1, tzinfo=UTC),
+                primary_provider=primary,
+                fallback_provider=MagicMock(),
+                rate_limiter=RateLimiter(0),
+                instrument_cache={"AAA": cached},
+                progress=SeedProgress(),
+                years=1,
+            )
+
+        assert results == [True]
+        primary.fetch_ohlcv_batch.assert_not_called()
 
 
 class TestScriptIntegration:
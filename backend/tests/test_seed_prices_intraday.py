@@ -0,0 +1,402 @@
+"""
+Tests for the seed_prices_intraday.py script.
+
+Validates key functionality including:
+- Batches fetched concurrently, one provider call each
+- Per-ticker progress and error tracking
+"""
+
+import asyncio
+import json
+import shelve
+import threading
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import numpy as np
+import pandas as pd
+from scripts.seed_prices_intraday import (
+    NO_EXISTING_BARS,
+    CachedOHLCVProvider,
+    IntradayProgress,
+    check_existing_intraday_data,
+    insert_price_bars_bulk,
+    load_existing_timestamps,
+    load_or_create_instruments,
+    seed_intraday_async,
+)
+from sqlmodel import Session
+
+from app.models import Instrument
+
+
+def _make_df():
+    dates = pd.date_range("2024-01-02 14:30", periods=3, freq="15min", tz=UTC)
+    return pd.DataFrame(
+        {
+            "Open": [100.0, 101.0, 102.0],
+            "High": [105.0, 106.0, 107.0],
+            "Low": [95.0, 96.0, 97.0],
+            "Close": [102.0, 103.0, 104.0],
+            "Volume": [1000, 1100, 1200],
+        },
+        index=dates,
+    )
+
+
+class TestIntradayProgress:
+    """Test checkpoint serialization."""
+
+    def test_checkpoint_keeps_latest_error_per_ticker(self, tmp_path):
+        """Test a retried ticker appears once in the checkpoint, with its latest error."""
+        progress = IntradayProgress()
+        progress.errors = [
+            {"ticker": "AAA", "error": "timeout"},
+            {"ticker": "BBB", "error": "no data"},
+            {"ticker": "AAA", "error": "rate limit"},
+        ]
+        filename = tmp_path / "checkpoint.json"
+
+        progress.save_checkpoint(str(filename))
+
+        checkpoint = json.loads(filename.read_text())
+        assert checkpoint["errors"] == [
+            {"ticker": "AAA", "error": "rate limit"},
+            {"ticker": "BBB", "error": "no data"},
+        ]
+        assert "\n" not in filename.read_text()
+
+
+class TestCachedOHLCVProvider:
+    """Test the on-disk provider response cache."""
+
+    START = datetime(2024, 1, 1, tzinfo=UTC)
+    END = datetime(2024, 1, 31, tzinfo=UTC)
+
+    def test_second_fetch_hits_cache(self, tmp_path):
+        """Test cached tickers are served from disk and only misses are fetched."""
+        provider = MagicMock()
+        provider.fetch_ohlcv.side_effect = lambda tickers, **_: {
+            ticker: _make_df() for ticker in tickers
+        }
+        cached = CachedOHLCVProvider(provider, str(tmp_path / "cache"))
+
+        cached.fetch_ohlcv(["AAA"], self.START, self.END, "15m")
+        data = cached.fetch_ohlcv(["AAA", "BBB"], self.START, self.END, "15m")
+
+        assert set(data) == {"AAA", "BBB"}
+        pd.testing.assert_frame_equal(data["AAA"], _make_df())
+        assert provider.fetch_ohlcv.call_count == 2
+        assert provider.fetch_ohlcv.call_args.kwargs["tickers"] == ["BBB"]
+
+    def test_expired_entries_are_refetched(self, tmp_path):
+        """Test entries older than the TTL are fetched again."""
+        provider = MagicMock()
+        provider.fetch_ohlcv.return_value = {"AAA": _make_df()}
+        cached = CachedOHLCVProvider(provider, str(tmp_path / "cache"), ttl=timedelta(0))
+
+        cached.fetch_ohlcv(["AAA"], self.START, self.END, "15m")
+        cached.fetch_ohlcv(["AAA"], self.START, self.END, "15m")
+
+        assert provider.fetch_ohlcv.call_count == 2
+
+    def test_expired_entries_are_deleted(self, tmp_path):
+        """Test expired entries are removed from disk instead of accumulating."""
+        provider = MagicMock()
+        provider.fetch_ohlcv.return_value = {"AAA": _make_df()}
+        path = str(tmp_path / "cache")
+        CachedOHLCVProvider(provider, path).fetch_ohlcv(["AAA"], self.START, self.END, "15m")
+
+        cached = CachedOHLCVProvider(provider, path, ttl=timedelta(0))
+
+        assert cached.purge_expired() == 0
+        with shelve.open(path) as cache:
+            assert len(cache) == 0
+
+
+class TestLoadOrCreateInstruments:
+    """Test up-front instrument resolution (mocked database)."""
+
+    def test_bulk_creates_missing_symbols(self):
+        """Test existing symbols come from one query and missing ones from one insert."""
+        existing = Instrument(id=uuid4(), symbol="AAA", exchange="NASDAQ")
+        created = Instrument(id=uuid4(), symbol="BBB", exchange="NASDAQ")
+        mock_session = MagicMock(spec=Session)
+        reloaded = Instrument(id=existing.id, symbol="AAA", exchange="NASDAQ")
+        mock_session.exec.return_value.all.side_effect = [[existing], [reloaded, created]]
+
+        by_symbol = load_or_create_instruments(mock_session, ["AAA", "BBB"])
+
+        # Every symbol is reloaded after the commit, not only the created ones
+        assert by_symbol == {"AAA": reloaded, "BBB": created}
+        assert by_symbol["AAA"] is reloaded
+        mock_session.execute.assert_called_once()
+        _, rows = mock_session.execute.call_args.args
+        assert [row["symbol"] for row in rows] == ["BBB"]
+        mock_session.commit.assert_called_once()
+
+    def test_no_insert_when_all_exist(self):
+        """Test nothing is inserted when every symbol already exists."""
+        existing = Instrument(id=uuid4(), symbol="AAA", exchange="NASDAQ")
+        mock_session = MagicMock(spec=Session)
+        mock_session.exec.return_value.all.return_value = [existing]
+
+        by_symbol = load_or_create_instruments(mock_session, ["AAA"])
+
+        assert by_symbol == {"AAA": existing}
+        mock_session.execute.assert_not_called()
+        mock_session.commit.assert_not_called()
+
+
+class TestCheckExistingIntradayData:
+    """Test existing bar counting (mocked database)."""
+
+    def test_returns_count(self):
+        """Test existing bar count comes from a single COUNT query."""
+        mock_session = MagicMock(spec=Session)
+        mock_exec = MagicMock()
+        mock_exec.one.return_value = 780
+        mock_session.exec.return_value = mock_exec
+
+        count = check_existing_intraday_data(mock_session, uuid4(), datetime.now(UTC))
+
+        assert count == 780
+        assert "count(" in str(mock_session.exec.call_args.args[0])
+        mock_exec.all.assert_not_called()
+
+
+class TestInsertPriceBarsBulk:
+    """Test intraday bar insertion (mocked database)."""
+
+    def test_skips_existing_bars_in_window(self):
+        """Test existing bars within the fetched window are skipped."""
+        mock_session = MagicMock(spec=Session)
+        # Timestamp columns come back naive from the database
+        mock_session.execute.return_value.scalars.return_value = [
+            datetime(2024, 1, 2, 14, 45, tzinfo=UTC).replace(tzinfo=None)
+        ]
+        connection = mock_session.connection.return_value
+        cursor = connection.connection.cursor.return_value.__enter__.return_value
+        copy = cursor.copy.return_value.__enter__.return_value
+        instrument_id = uuid4()
+        insert_result = MagicMock()
+        insert_result.scalars.return_value = [instrument_id] * 2
+        connection.exec_driver_sql.side_effect = [MagicMock(), insert_result, MagicMock()]
+
+        inserted, skipped = insert_price_bars_bulk(mock_session, instrument_id, _make_df(), "15m")
+
+        assert inserted == 2
+        assert skipped == 1
+        existing_statement = mock_session.execute.call_args.args[0]
+        assert "BETWEEN" in str(existing_statement)
+
+        assert "COPY price_bars_staging" in cursor.copy.call_args.args[0]
+        rows = copy.write.call_args.args[0].splitlines()
+        assert rows == [
+            f"{instrument_id},2024-01-02 14:30:00,100.0,105.0,95.0,102.0,1000.0,15m",
+            f"{instrument_id},2024-01-02 15:00:00,102.0,107.0,97.0,104.0,1200.0,15m",
+        ]
+        insert_sql = connection.exec_driver_sql.call_args_list[1].args[0]
+        assert "ON CONFLICT (instrument_id, ts, interval) DO NOTHING" in insert_sql
+        mock_session.commit.assert_called_once()
+
+    def test_keeps_full_precision_and_nan(self):
+        """Test 4-decimal prices above 1000 round-trip exactly and NaN is not NULL."""
+        mock_session = MagicMock(spec=Session)
+        connection = mock_session.connection.return_value
+        cursor = connection.connection.cursor.return_value.__enter__.return_value
+        copy = cursor.copy.return_value.__enter__.return_value
+        df = _make_df().iloc[:1].copy()
+        df["Open"] = 4523.4501
+        df["Close"] = 4520.1234
+        df["Volume"] = float("nan")
+
+        insert_price_bars_bulk(mock_session, uuid4(), df, "15m", NO_EXISTING_BARS)
+
+        row = copy.write.call_args.args[0].strip().split(",")
+        assert row[2] == "4523.4501"
+        assert row[5] == "4520.1234"
+        assert row[6] == "NaN"
+
+    def test_all_existing_skips_copy(self):
+        """Test nothing is streamed when every bar already exists."""
+        mock_session = MagicMock(spec=Session)
+        df = _make_df()
+        mock_session.execute.return_value.scalars.return_value = [
+            ts.to_pydatetime() for ts in df.index
+        ]
+
+        inserted, skipped = insert_price_bars_bulk(mock_session, uuid4(), df, "15m")
+
+        assert (inserted, skipped) == (0, 3)
+        mock_session.connection.assert_not_called()
+        mock_session.commit.assert_not_called()
+
+
+class TestLoadExistingTimestamps:
+    """Test run-wide preloading of existing bars (mocked database)."""
+
+    def test_groups_by_instrument_in_one_query(self):
+        """Test one query returns epoch-ns timestamp arrays keyed by instrument."""
+        first_id, second_id = uuid4(), uuid4()
+        mock_session = MagicMock(spec=Session)
+        mock_session.execute.return_value = iter(
+            [
+                (first_id, datetime(2024, 1, 2, 14, 30, tzinfo=UTC).replace(tzinfo=None)),
+                (first_id, datetime(2024, 1, 2, 14, 45, tzinfo=UTC).replace(tzinfo=None)),
+                (second_id, datetime(2024, 1, 2, 14, 30, tzinfo=UTC)),
+            ]
+        )
+
+        existing = load_existing_timestamps(
+            mock_session, [first_id, second_id], datetime(2024, 1, 1, tzinfo=UTC)
+        )
+
+        mock_session.execute.assert_called_once()
+        first_bar = pd.Timestamp("2024-01-02 14:30", tz=UTC).value
+        second_bar = pd.Timestamp("2024-01-02 14:45", tz=UTC).value
+        assert existing[first_id].dtype == np.int64
+        assert existing[first_id].tolist() == [first_bar, second_bar]
+        assert existing[second_id].tolist() == [first_bar]
+
+    def test_preloaded_timestamps_skip_window_query(self):
+        """Test insert uses preloaded timestamps instead of querying."""
+        mock_session = MagicMock(spec=Session)
+        df = _make_df()
+        existing = df.index.as_unit("ns").asi8
+
+        inserted, skipped = insert_price_bars_bulk(mock_session, uuid4(), df, "15m", existing)
+
+        assert (inserted, skipped) == (0, 3)
+        mock_session.execute.assert_not_called()
+
+
+class TestSeedIntradayAsync:
+    """Test concurrent chunked intraday seeding (mocked provider and database)."""
+
+    START = datetime(2024, 1, 1, tzinfo=UTC)
+    END = datetime(2024, 1, 31, tzinfo=UTC)
+
+    def _patch_db(self, mocker, existing_count=0):
+        mocker.patch(
+            "scripts.seed_prices_intraday.get_or_create_instrument",
+            side_effect=lambda _, symbol: Instrument(id=uuid4(), symbol=symbol, exchange="NASDAQ"),
+        )
+        mocker.patch("scripts.seed_prices_intraday.IntradayProgress.save_checkpoint")
+        mocker.patch("scripts.seed_prices_intraday.load_or_create_instruments", return_value={})
+        self.mock_engine = mocker.patch("scripts.seed_prices_intraday.engine")
+        self.mock_worker_session = mocker.patch("scripts.seed_prices_intraday.Session")
+        mocker.patch(
+            "scripts.seed_prices_intraday.check_existing_intraday_data",
+            return_value=existing_count,
+        )
+        return mocker.patch(
+            "scripts.seed_prices_intraday.insert_price_bars_bulk", return_value=(3, 0)
+        )
+
+    def _run(self, batches, provider, progress, max_workers=8, db_workers=4):
+        return asyncio.run(
+            seed_intraday_async(
+                MagicMock(spec=Session),
+                batches,
+                self.START,
+                self.END,
+                provider,
+                progress,
+                max_workers=max_workers,
+                db_workers=db_workers,
+            )
+        )
+
+    def test_single_provider_call_per_chunk(self, mocker):
+        """Test the chunk is fetched in one provider call and missing tickers fail."""
+        mock_insert = self._patch_db(mocker)
+        provider = MagicMock()
+        provider.fetch_ohlcv.return_value = {"AAA": _make_df(), "CCC": _make_df()}
+
+        progress = IntradayProgress()
+        results = self._run([["AAA", "BBB", "CCC"]], provider, progress)
+
+        assert results == [True, False, True]
+        provider.fetch_ohlcv.assert_called_once()
+        assert provider.fetch_ohlcv.call_args.kwargs["tickers"] == ["AAA", "BBB", "CCC"]
+        assert provider.fetch_ohlcv.call_args.kwargs["interval"] == "15m"
+        assert mock_insert.call_count == 2
+        assert progress.total_bars_inserted == 6
+        assert [(e["ticker"], e["stage"]) for e in progress.errors] == [("BBB", "fetch")]
+
+    def test_insert_failure_recorded_as_insert_stage(self, mocker):
+        """Test a failed insert is reported as an insert error, not a fetch error."""
+        mock_insert = self._patch_db(mocker)
+        mock_insert.side_effect = Exception("deadlock detected")
+        provider = MagicMock()
+        provider.fetch_ohlcv.return_value = {"AAA": _make_df()}
+
+        progress = IntradayProgress()
+        results = self._run([["AAA"]], provider, progress)
+
+        assert results == [False]
+        assert [(e["ticker"], e["stage"]) for e in progress.errors] == [("AAA", "insert")]
+
+    def test_worker_session_reused_across_tickers(self, mocker):
+        """Test a worker thread keeps one Session and connection for all its inserts."""
+        mock_insert = self._patch_db(mocker)
+        provider = MagicMock()
+        provider.fetch_ohlcv.side_effect = lambda tickers, **_: {
+            ticker: _make_df() for ticker in tickers
+        }
+
+        self._run([["AAA", "BBB"], ["CCC"]], provider, IntradayProgress(), db_workers=1)
+
+        assert mock_insert.call_count == 3
+        self.mock_engine.connect.assert_called_once()
+        self.mock_worker_session.assert_called_once_with(bind=self.mock_engine.connect.return_value)
+        worker_session = self.mock_worker_session.return_value
+        assert all(call.args[0] is worker_session for call in mock_insert.call_args_list)
+        worker_session.close.assert_called_once()
+        worker_session.bind.close.assert_called_once()
+
+    def test_sufficient_data_skips_request(self, mocker):
+        """Test tickers with enough bars are not requested."""
+        self._patch_db(mocker, existing_count=1000)
+        provider = MagicMock()
+
+        results = self._run([["AAA"]], provider, IntradayProgress())
+
+        assert results == [True]
+        provider.fetch_ohlcv.assert_not_called()
+
+    def test_request_failure_fails_whole_chunk(self, mocker):
+        """Test a failed request marks every requested ticker as failed."""
+        self._patch_db(mocker)
+        provider = MagicMock()
+        provider.fetch_ohlcv.side_effect = Exception("rate limit exceeded")
+
+        progress = IntradayProgress()
+        results = self._run([["AAA", "BBB"]], provider, progress)
+
+        assert results == [False, False]
+        assert progress.quota_warnings == 2
+        assert len(progress.errors) == 2
+
+    def test_batches_fetched_concurrently_and_kept_in_order(self, mocker):
+        """Test one provider call per batch, all in flight together, results in order."""
+        self._patch_db(mocker)
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fetch(tickers, **_):
+            # Both requests must be in flight at once to pass the barrier
+            barrier.wait()
+            return {ticker: _make_df() for ticker in tickers if ticker != "CCC"}
+
+        provider = MagicMock()
+        provider.fetch_ohlcv.side_effect = fetch
+
+        progress = IntradayProgress()
+        results = self._run([["AAA", "BBB"], ["CCC", "DDD"]], provider, progress)
+
+        assert results == [True, True, False, True]
+        assert provider.fetch_ohlcv.call_count == 2
+        assert progress.processed_tickers == 4
+        assert progress.failed_tickers == 1
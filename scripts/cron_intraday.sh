@@ -41,9 +41,9 @@ echo "Running intraday data ingestion..." | tee -a "$LOG_FILE"
 python3 scripts/seed_prices_intraday.py \
     --max-tickers 300 \
     --days 30 \
-    --batch-size 10 \
-    --delay 1.0 \
+    --batch-size 50 \
     --batch-delay 10 \
+    --rate-limit 1.0 \
     2>&1 | tee -a "$LOG_FILE"
 
 # Capture exit code
@@ -8,6 +8,7 @@ and shows how to use the features module with realistic price data.
 Can be converted to a Jupyter notebook using jupytext or run as a Python script.
 """
 
+import functools
 import logging
 import sys
 from datetime import datetime
@@ -35,6 +36,99 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _synth_ohlcv(
+    returns: np.ndarray,
+    high_pct: np.ndarray,
+    low_pct: np.ndarray,
+    open_pct: np.ndarray,
+    initial_price: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Build open/high/low/close price arrays from daily random draws.
+    
+    Each output array is allocated once and then updated with in-place ufuncs,
+    so no intermediate arrays are created along the way.
+    
+    Args:
+        returns: Daily log returns
+        high_pct: Fraction of close added to get the intraday high
+        low_pct: Fraction of close removed to get the intraday low
+        open_pct: Signed fraction of close giving the open
+        initial_price: Starting price
+    
+    Returns:
+        Tuple of (open, high, low, close) arrays
+    """
+    # Calculate close prices from log returns
+    close_prices = np.cumsum(returns)
+    close_prices += np.log(initial_price)
+    np.exp(close_prices, out=close_prices)
+    
+    # Ensure OHLC consistency (high >= max(open, close), low <= min(open, close)).
+    # Prices are positive, so clamping the multipliers against the open multiplier
+    # and 1.0 (the close) gives the same result with a single multiply per column.
+    open_prices = np.add(open_pct, 1.0)
+    high_prices = np.add(high_pct, 1.0)
+    np.maximum(high_prices, open_prices, out=high_prices)
+    np.maximum(high_prices, 1.0, out=high_prices)
+    low_prices = np.subtract(1.0, low_pct)
+    np.minimum(low_prices, open_prices, out=low_prices)
+    np.minimum(low_prices, 1.0, out=low_prices)
+    
+    open_prices *= close_prices
+    high_prices *= close_prices
+    low_prices *= close_prices
+    
+    return open_prices, high_prices, low_prices, close_prices
+
+
+@functools.lru_cache(maxsize=32)
+def _core_arrays(
+    days: int,
+    initial_price: float,
+    volatility: float,
+    trend: float,
+    seed: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Draw the random series and build read-only OHLCV arrays.
+    
+    Cached on its arguments so repeated demo runs with the same parameters reuse
+    the arrays instead of regenerating them.
+    
+    Returns:
+        Tuple of (open, high, low, close, volume) arrays
+    """
+    rng = np.random.default_rng(seed)
+    
+    # Generate log returns with trend and volatility, scaling a standard normal draw
+    # in place
+    returns = rng.standard_normal(days)
+    returns *= volatility
+    returns += trend
+    
+    # Generate OHLC from close with realistic intraday patterns
+    high_pct, low_pct = rng.uniform(0.005, 0.025, (2, days))
+    open_pct = rng.uniform(-0.01, 0.01, days)
+    
+    open_prices, high_prices, low_prices, close_prices = _synth_ohlcv(
+        returns, high_pct, low_pct, open_pct, initial_price
+    )
+    
+    # Generate volume (log-normal distribution)
+    avg_volume = 1_000_000
+    volume = rng.standard_normal(days)
+    volume *= 0.5
+    volume += np.log(avg_volume)
+    np.exp(volume, out=volume)
+    
+    arrays = (open_prices, high_prices, low_prices, close_prices, volume)
+    for array in arrays:
+        array.setflags(write=False)
+    
+    return arrays
+
+
 def generate_sample_ohlcv_data(
     start_date: str = "2016-01-01",
     days: int = 2000,
@@ -57,36 +151,14 @@ def generate_sample_ohlcv_data(
     Returns:
         DataFrame with OHLCV columns and timestamp index
     """
-    np.random.seed(seed)
-    
     # Generate dates (business days only)
     dates = pd.bdate_range(start=start_date, periods=days, freq="B")
     
-    # Generate log returns with trend and volatility
-    returns = np.random.normal(trend, volatility, days)
-    
-    # Calculate close prices from log returns
-    log_prices = np.log(initial_price) + np.cumsum(returns)
-    close_prices = np.exp(log_prices)
-    
-    # Generate OHLC from close with realistic intraday patterns
-    high_pct = np.random.uniform(0.005, 0.025, days)
-    low_pct = np.random.uniform(0.005, 0.025, days)
-    open_pct = np.random.uniform(-0.01, 0.01, days)
-    
-    high_prices = close_prices * (1 + high_pct)
-    low_prices = close_prices * (1 - low_pct)
-    open_prices = close_prices * (1 + open_pct)
-    
-    # Ensure OHLC consistency (high >= max(open, close), low <= min(open, close))
-    high_prices = np.maximum(high_prices, np.maximum(open_prices, close_prices))
-    low_prices = np.minimum(low_prices, np.minimum(open_prices, close_prices))
-    
-    # Generate volume (log-normal distribution)
-    avg_volume = 1_000_000
-    volume = np.random.lognormal(np.log(avg_volume), 0.5, days)
+    open_prices, high_prices, low_prices, close_prices, volume = _core_arrays(
+        days, initial_price, volatility, trend, seed
+    )
     
-    # Create DataFrame
+    # Create DataFrame (copies the cached arrays)
     df = pd.DataFrame(
         {
             "o": open_prices,
@@ -113,8 +185,8 @@ def demo_basic_features():
     
     logger.info(f"Sample data shape: {price_df.shape}")
     logger.info(f"Date range: {price_df.index[0]} to {price_df.index[-1]}")
-    logger.info("\nFirst few rows:")
-    logger.info(price_df.head())
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("\nFirst few rows:\n%s", price_df.head().to_string())
     
     # Compute features
     logger.info("\nComputing features...")
@@ -122,8 +194,11 @@ def demo_basic_features():
     
     logger.info(f"\nFeatures shape: {features_df.shape}")
     logger.info(f"Feature columns: {get_feature_columns()}")
-    logger.info("\nFirst few rows of features:")
-    logger.info(features_df[get_feature_columns()].head())
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "\nFirst few rows of features:\n%s",
+            features_df[get_feature_columns()].head().to_string(),
+        )
     
     # Validate
     stats = validate_features(features_df)
@@ -12,9 +12,9 @@ Features:
 - Batch processing with configurable batch size
 - Progress tracking with detailed logging
 - Automatic retry on failures with exponential backoff
-- Rate limiting to avoid API quotas
+- Concurrent provider fetches with a shared rate limiter to avoid API quotas
 - Partial restart capability (resume from specific ticker)
-- Bulk insert for better performance
+- Bulk load via PostgreSQL COPY per batch, deduplicated with ON CONFLICT DO NOTHING
 - Target: ≥98% data coverage
 """
 
@@ -23,6 +23,7 @@ import json
 import logging
 import sys
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any
@@ -32,9 +33,15 @@ import pandas as pd
 # Add backend directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "backend"))
 
-from app.data_provider import create_data_provider_with_fallback
+from app.data_provider import (
+    RateLimiter,
+    create_data_provider_with_fallback,
+    fetch_ohlcv_rate_limited,
+)
 from app.database import engine
 from app.models import Instrument, PriceBar
+from app.price_bars import copy_price_bars_batch
+from sqlalchemy import func
 from sqlmodel import Session, select
 
 # Configure structured logging
@@ -120,6 +127,7 @@ class SeedProgress:
         self.total_bars_skipped = 0
         self.start_time = datetime.now(UTC)
         self.errors: list[dict[str, Any]] = []
+        self._checkpointed_errors = 0
 
     def to_dict(self) -> dict[str, Any]:
         """Convert progress to dictionary for logging."""
@@ -140,17 +148,40 @@ class SeedProgress:
             else "N/A",
         }
 
-    def save_checkpoint(self, filename: str = "seed_checkpoint.json"):
-        """Save progress checkpoint for restart capability."""
+    def save_checkpoint(
+        self, filename: str = "seed_checkpoint.jsonl", batch_idx: int | None = None
+    ):
+        """
+        Append a progress checkpoint line for restart capability.
+
+        Each line only carries the errors recorded since the previous checkpoint,
+        so the cost of a checkpoint does not grow with the length of the run. Lines
+        are tagged with the run's start time, since batch_idx restarts every run.
+        """
         checkpoint = {
+            "run_started_at": self.start_time.isoformat(),
+            "progress": self.to_dict(),
+            "errors": self.errors[self._checkpointed_errors :],
+            "last_successful_ticker_index": self.processed_tickers - 1,
+            "batch_idx": batch_idx,
+            "timestamp": datetime.now(UTC).isoformat(),
+        }
+        with open(filename, "a") as f:
+            f.write(json.dumps(checkpoint) + "\n")
+        self._checkpointed_errors = len(self.errors)
+        logger.info(f"Checkpoint appended to {filename}")
+
+    def save_final_state(self, filename: str = "seed_final_state.json"):
+        """Save the complete final progress state, including all errors."""
+        state = {
             "progress": self.to_dict(),
             "errors": self.errors,
             "last_successful_ticker_index": self.processed_tickers - 1,
             "timestamp": datetime.now(UTC).isoformat(),
         }
         with open(filename, "w") as f:
-            json.dump(checkpoint, f, indent=2)
-        logger.info(f"Checkpoint saved to {filename}")
+            json.dump(state, f, indent=2)
+        logger.info(f"Final state saved to {filename}")
 
 
 def get_or_create_instrument(session: Session, symbol: str, exchange: str = "NASDAQ") -> Instrument:
@@ -173,186 +204,221 @@ def get_or_create_instrument(session: Session, symbol: str, exchange: str = "NAS
         is_active=True,
     )
     session.add(instrument)
-    session.commit()
-    session.refresh(instrument)
+    # Flush only; the caller commits once per batch
+    session.flush()
     logger.info(f"Created new instrument: {symbol} ({instrument.id})")
     return instrument
 
 
+def load_instrument_cache(
+    session: Session, symbols: list[str], exchange: str = "NASDAQ"
+) -> dict[str, Any]:
+    """
+    Fetch the ids of all existing instruments for the given symbols in a single query.
+
+    Ids rather than ORM objects are cached, since the per-batch commits expire the
+    objects and each attribute access would reload them.
+    """
+    statement = select(Instrument.symbol, Instrument.id).where(
+        Instrument.symbol.in_(symbols), Instrument.exchange == exchange
+    )
+    return dict(session.exec(statement).all())
+
+
 def check_existing_data(session: Session, instrument_id: Any, start_date: datetime) -> int:
     """Check how many price bars already exist for this instrument."""
     statement = (
-        select(PriceBar)
+        select(func.count(PriceBar.id))
         .where(PriceBar.instrument_id == instrument_id)
         .where(PriceBar.interval == "daily")
         .where(PriceBar.ts >= start_date)
     )
-    existing_count = len(session.exec(statement).all())
-    return existing_count
+    return session.exec(statement).one()
 
 
-def insert_price_bars_bulk(
-    session: Session,
-    instrument_id: Any,
-    df: pd.DataFrame,
-    interval: str = "daily",
-) -> tuple[int, int]:
+def fetch_chunk_data(
+    tickers: list[str],
+    start_date: datetime,
+    end_date: datetime,
+    primary_provider: Any,
+    fallback_provider: Any,
+    rate_limiter: RateLimiter,
+) -> tuple[dict[str, pd.DataFrame], dict[str, str]]:
     """
-    Bulk insert price bars from DataFrame.
+    Fetch daily OHLCV data for a chunk of tickers.
+
+    The primary provider downloads the whole chunk in one request; tickers it returns
+    no data for are retried with the fallback provider. Every provider request takes
+    a slot from the shared rate limiter.
+    Performs network I/O only (no database access), so it is safe to run in worker
+    threads.
 
     Returns:
-        Tuple of (inserted_count, skipped_count)
+        Tuple of (data by ticker, error message by ticker for tickers with no data)
     """
-    if df.empty:
-        return 0, 0
-
-    inserted = 0
-    skipped = 0
-
-    # Get existing timestamps to avoid duplicates
-    existing_statement = (
-        select(PriceBar.ts)
-        .where(PriceBar.instrument_id == instrument_id)
-        .where(PriceBar.interval == interval)
+    # Fetch data from primary provider
+    logger.info(f"Fetching data for {', '.join(tickers)} from primary provider...")
+    data, primary_errors = fetch_ohlcv_rate_limited(
+        primary_provider, tickers, start_date, end_date, rate_limiter
     )
-    existing_timestamps = {ts for (ts,) in session.exec(existing_statement).all()}
-
-    # Prepare batch of price bars
-    price_bars = []
-    for timestamp, row in df.iterrows():
-        # Convert pandas Timestamp to datetime
-        ts = timestamp.to_pydatetime()
-        if ts.tzinfo is None:
-            ts = ts.replace(tzinfo=UTC)
-
-        # Skip if already exists
-        if ts in existing_timestamps:
-            skipped += 1
-            continue
+    for ticker, error in primary_errors.items():
+        logger.warning(f"Primary provider failed for {ticker}: {error}")
 
-        price_bar = PriceBar(
-            instrument_id=instrument_id,
-            ts=ts,
-            o=float(row["Open"]),
-            h=float(row["High"]),
-            l=float(row["Low"]),
-            c=float(row["Close"]),
-            v=float(row["Volume"]),
-            interval=interval,
-        )
-        price_bars.append(price_bar)
-        inserted += 1
+    missing = [ticker for ticker in tickers if ticker not in data]
+    if not missing:
+        return data, {}
 
-    # Bulk insert
-    if price_bars:
-        session.add_all(price_bars)
-        session.commit()
+    # Try fallback provider for whatever the primary did not return
+    logger.warning(f"No primary data for {', '.join(missing)}, trying fallback...")
+    fetched, fallback_errors = fetch_ohlcv_rate_limited(
+        fallback_provider, missing, start_date, end_date, rate_limiter
+    )
+    data.update(fetched)
 
-    return inserted, skipped
+    errors = {
+        ticker: fallback_errors.get(ticker, f"No data returned from fallback for {ticker}")
+        for ticker in missing
+        if ticker not in fetched
+    }
+    return data, errors
 
 
-def seed_ticker(
+def seed_batch(
     session: Session,
-    ticker: str,
+    executor: ThreadPoolExecutor,
+    tickers: list[str],
     start_date: datetime,
     end_date: datetime,
     primary_provider: Any,
     fallback_provider: Any,
+    rate_limiter: RateLimiter,
+    instrument_cache: dict[str, Any],
     progress: SeedProgress,
-) -> bool:
+    fetch_chunk_size: int = 5,
+    years: int = 8,
+) -> list[bool]:
     """
-    Seed price data for a single ticker.
+    Seed price data for a batch of tickers.
+
+    Tickers are fetched in chunks of fetch_chunk_size, one provider request and one
+    worker task per chunk, with chunks running concurrently on the executor (so the
+    batch size should exceed the chunk size); all database work stays on the calling
+    thread, which owns the Session. The fetched bars are then loaded with one COPY
+    inside a savepoint; committing is left to the caller. A ticker is skipped when
+    it already holds ~95% of the trading days expected over the requested number
+    of years.
 
     Returns:
-        True if successful, False otherwise
+        List of success flags, one per ticker in input order
     """
-    try:
-        logger.info(f"Processing ticker: {ticker}")
-
-        # Get or create instrument
-        instrument = get_or_create_instrument(session, ticker)
+    instrument_ids: dict[str, Any] = {}
+    to_fetch: list[str] = []
+    results: list[bool] = []
+    expected_trading_days = 252 * years  # Approx 252 trading days per year
 
-        # Check existing data
-        existing_count = check_existing_data(session, instrument.id, start_date)
-        expected_trading_days = 252 * 8  # Approx 252 trading days per year * 8 years
-        
-        if existing_count >= expected_trading_days * 0.95:
-            logger.info(
-                f"Ticker {ticker} already has sufficient data ({existing_count} bars), skipping"
-            )
-            progress.total_bars_skipped += existing_count
-            return True
-
-        # Fetch data from primary provider
+    # Resolve instruments and skip tickers that already have enough data
+    for ticker in tickers:
         try:
-            logger.info(f"Fetching data for {ticker} from primary provider...")
-            data = primary_provider.fetch_ohlcv(
-                tickers=[ticker],
-                start_date=start_date,
-                end_date=end_date,
-                interval="1d",
-            )
-
-            if ticker not in data or data[ticker].empty:
-                raise ValueError(f"No data returned for {ticker}")
-
-            df = data[ticker]
+            logger.info(f"Processing ticker: {ticker}")
+            instrument_id = instrument_cache.get(ticker)
+            if instrument_id is None:
+                with session.begin_nested():
+                    instrument_id = get_or_create_instrument(session, ticker).id
+                instrument_cache[ticker] = instrument_id
+
+            existing_count = check_existing_data(session, instrument_id, start_date)
+            # Only tickers that passed every check count as resolved; failures stay
+            # out of instrument_ids and are reported as failed below
+            instrument_ids[ticker] = instrument_id
+
+            if existing_count >= expected_trading_days * 0.95:
+                logger.info(
+                    f"Ticker {ticker} already has sufficient data ({existing_count} bars), "
+                    "skipping"
+                )
+                progress.total_bars_skipped += existing_count
+                continue
 
+            to_fetch.append(ticker)
         except Exception as e:
-            logger.warning(
-                f"Primary provider failed for {ticker}: {e}, trying fallback..."
+            logger.error(f"Unexpected error processing {ticker}: {e}", exc_info=True)
+            progress.errors.append(
+                {
+                    "ticker": ticker,
+                    "error": str(e),
+                    "timestamp": datetime.now(UTC).isoformat(),
+                }
             )
-            # Try fallback provider
-            try:
-                data = fallback_provider.fetch_ohlcv(
-                    tickers=[ticker],
-                    start_date=start_date,
-                    end_date=end_date,
-                    interval="1d",
-                )
 
-                if ticker not in data or data[ticker].empty:
-                    raise ValueError(f"No data returned from fallback for {ticker}")
+    # Fetch the remaining tickers in chunks, one worker task each
+    futures: list[Future] = [
+        executor.submit(
+            fetch_chunk_data,
+            to_fetch[i : i + fetch_chunk_size],
+            start_date,
+            end_date,
+            primary_provider,
+            fallback_provider,
+            rate_limiter,
+        )
+        for i in range(0, len(to_fetch), fetch_chunk_size)
+    ]
+
+    fetched: dict[str, pd.DataFrame] = {}
+    fetch_errors: dict[str, str] = {}
+    for future in futures:
+        data, errors = future.result()
+        fetched.update(data)
+        fetch_errors.update(errors)
+
+    # Bulk load every fetched ticker of the batch with a single COPY
+    loaded = [ticker for ticker in to_fetch if ticker in fetched]
+    counts: dict[Any, tuple[int, int]] = {}
+    load_error = None
+    if loaded:
+        try:
+            with session.begin_nested():
+                counts = copy_price_bars_batch(
+                    session, {instrument_ids[ticker]: fetched[ticker] for ticker in loaded}
+                )
+        except Exception as e:
+            logger.error(f"Bulk load failed for batch: {e}", exc_info=True)
+            load_error = str(e)
 
-                df = data[ticker]
+    # Report results in input order
+    for ticker in tickers:
+        if ticker not in instrument_ids:
+            results.append(False)
+            continue
 
-            except Exception as fallback_error:
-                logger.error(f"Both providers failed for {ticker}: {fallback_error}")
-                progress.errors.append(
-                    {
-                        "ticker": ticker,
-                        "error": str(fallback_error),
-                        "timestamp": datetime.now(UTC).isoformat(),
-                    }
-                )
-                return False
+        if ticker not in to_fetch:
+            results.append(True)
+            continue
 
-        # Insert price bars
-        inserted, skipped = insert_price_bars_bulk(session, instrument.id, df, "daily")
+        error = fetch_errors.get(ticker) or load_error
+        if error:
+            if ticker in fetch_errors:
+                logger.error(f"Both providers failed for {ticker}: {error}")
+            progress.errors.append(
+                {
+                    "ticker": ticker,
+                    "error": error,
+                    "timestamp": datetime.now(UTC).isoformat(),
+                }
+            )
+            results.append(False)
+            continue
 
+        inserted, skipped = counts.get(instrument_ids[ticker], (0, 0))
         logger.info(
             f"Completed {ticker}: inserted={inserted}, skipped={skipped}, "
-            f"total_rows={len(df)}"
+            f"total_rows={len(fetched[ticker])}"
         )
-
         progress.total_bars_inserted += inserted
         progress.total_bars_skipped += skipped
+        results.append(True)
 
-        # Rate limiting - small delay to avoid hitting API limits
-        time.sleep(0.5)
-
-        return True
-
-    except Exception as e:
-        logger.error(f"Unexpected error processing {ticker}: {e}", exc_info=True)
-        progress.errors.append(
-            {
-                "ticker": ticker,
-                "error": str(e),
-                "timestamp": datetime.now(UTC).isoformat(),
-            }
-        )
-        return False
+    return results
 
 
 def main():
@@ -383,6 +449,24 @@ def main():
         default=8,
         help="Number of years of historical data to fetch (default: 8)",
     )
+    parser.add_argument(
+        "--fetch-chunk-size",
+        type=int,
+        default=5,
+        help="Number of tickers downloaded per provider request (default: 5)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=8,
+        help="Number of concurrent provider fetches (default: 8)",
+    )
+    parser.add_argument(
+        "--rate-limit",
+        type=float,
+        default=2.0,
+        help="Maximum provider requests per second across all workers (default: 2.0)",
+    )
 
     args = parser.parse_args()
 
@@ -400,57 +484,95 @@ def main():
     logger.info(f"Total tickers: {len(TICKER_LIST)}")
     logger.info(f"Starting from ticker index: {args.start_ticker}")
     logger.info(f"Batch size: {args.batch_size}")
+    logger.info(f"Fetch chunk size: {args.fetch_chunk_size}")
+    logger.info(f"Workers: {args.workers}")
+    logger.info(f"Rate limit: {args.rate_limit} requests/s")
     logger.info(f"Dry run: {args.dry_run}")
     logger.info("=" * 80)
 
     # Create data providers
     primary, fallback = create_data_provider_with_fallback()
+    rate_limiter = RateLimiter(args.rate_limit)
 
     # Process tickers
     tickers_to_process = TICKER_LIST[args.start_ticker :]
 
-    with Session(engine) as session:
-        for i, ticker in enumerate(tickers_to_process):
-            ticker_index = args.start_ticker + i
-            logger.info(f"\n{'=' * 60}")
-            logger.info(f"Ticker {ticker_index + 1}/{len(TICKER_LIST)}: {ticker}")
-            logger.info(f"{'=' * 60}")
+    with Session(engine) as session, ThreadPoolExecutor(max_workers=args.workers) as executor:
+        # Resolve all known instruments up front instead of one SELECT per ticker
+        instrument_cache = (
+            {} if args.dry_run else load_instrument_cache(session, tickers_to_process)
+        )
 
-            if args.dry_run:
-                logger.info(f"DRY RUN: Would process {ticker}")
-                progress.processed_tickers += 1
-                progress.successful_tickers += 1
-                continue
+        for batch_start in range(0, len(tickers_to_process), args.batch_size):
+            batch = tickers_to_process[batch_start : batch_start + args.batch_size]
+            batch_end = batch_start + len(batch)
 
-            success = seed_ticker(
-                session=session,
-                ticker=ticker,
-                start_date=start_date,
-                end_date=end_date,
-                primary_provider=primary,
-                fallback_provider=fallback,
-                progress=progress,
+            ticker_index = args.start_ticker + batch_start
+            logger.info(f"\n{'=' * 60}")
+            logger.info(
+                f"Tickers {ticker_index + 1}-{ticker_index + len(batch)}/{len(TICKER_LIST)}: "
+                f"{', '.join(batch)}"
             )
+            logger.info(f"{'=' * 60}")
 
-            progress.processed_tickers += 1
-            if success:
-                progress.successful_tickers += 1
+            if args.dry_run:
+                for ticker in batch:
+                    logger.info(f"DRY RUN: Would process {ticker}")
+                results = [True] * len(batch)
             else:
-                progress.failed_tickers += 1
+                bars_inserted_before = progress.total_bars_inserted
+                try:
+                    results = seed_batch(
+                        session=session,
+                        executor=executor,
+                        tickers=batch,
+                        start_date=start_date,
+                        end_date=end_date,
+                        primary_provider=primary,
+                        fallback_provider=fallback,
+                        rate_limiter=rate_limiter,
+                        instrument_cache=instrument_cache,
+                        progress=progress,
+                        fetch_chunk_size=args.fetch_chunk_size,
+                        years=args.years,
+                    )
+                    # Single commit for the whole batch
+                    session.commit()
+                except Exception as e:
+                    session.rollback()
+                    logger.error(f"Batch failed, rolled back: {e}", exc_info=True)
+                    progress.total_bars_inserted = bars_inserted_before
+                    for ticker in batch:
+                        # Instruments created in this batch were rolled back too
+                        instrument_cache.pop(ticker, None)
+                        progress.errors.append(
+                            {
+                                "ticker": ticker,
+                                "error": f"Batch rolled back: {e}",
+                                "timestamp": datetime.now(UTC).isoformat(),
+                            }
+                        )
+                    results = [False] * len(batch)
+
+            for success in results:
+                progress.processed_tickers += 1
+                if success:
+                    progress.successful_tickers += 1
+                else:
+                    progress.failed_tickers += 1
 
-            # Log progress periodically
-            if (i + 1) % args.batch_size == 0 or (i + 1) == len(tickers_to_process):
-                logger.info("\n" + "=" * 80)
-                logger.info("PROGRESS UPDATE")
-                logger.info(json.dumps(progress.to_dict(), indent=2))
-                logger.info("=" * 80 + "\n")
+            # Log progress after each batch
+            logger.info("\n" + "=" * 80)
+            logger.info("PROGRESS UPDATE")
+            logger.info(json.dumps(progress.to_dict(), indent=2))
+            logger.info("=" * 80 + "\n")
 
-                # Save checkpoint
-                progress.save_checkpoint()
+            # Save checkpoint
+            progress.save_checkpoint(batch_idx=batch_start // args.batch_size)
 
             # Longer pause between batches to respect rate limits
-            if (i + 1) % args.batch_size == 0 and (i + 1) < len(tickers_to_process):
-                logger.info(f"Batch completed. Pausing for 5 seconds...")
+            if not args.dry_run and batch_end < len(tickers_to_process):
+                logger.info("Batch completed. Pausing for 5 seconds...")
                 time.sleep(5)
 
     # Final summary
@@ -458,6 +580,7 @@ def main():
     logger.info("SEEDING COMPLETED")
     logger.info("=" * 80)
     logger.info(json.dumps(progress.to_dict(), indent=2))
+    progress.save_final_state()
 
     if progress.errors:
         logger.warning(f"\nErrors encountered: {len(progress.errors)}")
@@ -10,7 +10,7 @@ Usage:
 
 Features:
 - Rolling 30-day window for intraday data
-- Batch processing with rate limiting
+- Concurrent batch fetches, one Yahoo request per batch, paced by a shared rate limiter
 - Progress tracking with detailed logging
 - Automatic retry on failures with exponential backoff
 - Quota management to respect free API limits
@@ -18,38 +18,62 @@ Features:
 """
 
 import argparse
+import asyncio
 import json
 import logging
+import logging.handlers
+import shelve
 import sys
-import time
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 # Add backend directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "backend"))
 
-from app.data_provider import create_data_provider_with_fallback
+from app.data_provider import (
+    RateLimitedProvider,
+    RateLimiter,
+    create_data_provider_with_fallback,
+)
 from app.database import engine
 from app.models import Instrument, PriceBar
+from app.price_bars import copy_price_bars_batch
+from sqlalchemy import func, insert
 from sqlmodel import Session, select
 
-# Configure structured logging
+# Configure structured logging. File records are buffered in memory and written
+# once per batch (or straight away on a warning); per-ticker detail is logged at
+# DEBUG so it reaches the file but not stdout.
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+file_handler = logging.FileHandler("seed_prices_intraday.log")
+file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+buffered_file_handler = logging.handlers.MemoryHandler(
+    capacity=1024, flushLevel=logging.WARNING, target=file_handler
+)
+stdout_handler = logging.StreamHandler(sys.stdout)
+stdout_handler.setLevel(logging.INFO)
 logging.basicConfig(
     level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.FileHandler("seed_prices_intraday.log"),
-        logging.StreamHandler(sys.stdout),
-    ],
+    format=LOG_FORMAT,
+    handlers=[buffered_file_handler, stdout_handler],
 )
 
 logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+
+# Empty epoch-ns array for instruments with no stored bars yet
+NO_EXISTING_BARS = np.empty(0, dtype=np.int64)
 
 # Top 300 US market stocks by market cap (same as daily ingestion)
-TICKER_LIST = [
+TICKER_LIST: tuple[str, ...] = (
     # Technology (Large Cap)
     "AAPL", "MSFT", "GOOGL", "AMZN", "META", "NVDA", "TSLA", "AVGO", "ORCL", "ADBE",
     "CRM", "CSCO", "ACN", "AMD", "INTC", "IBM", "TXN", "QCOM", "INTU", "NOW",
@@ -103,7 +127,7 @@ TICKER_LIST = [
     "PAYC", "WDAY", "DDOG", "SNOW", "ZS", "CRWD", "NET", "PANW", "OKTA", "TEAM",
     "MDB", "SHOP", "SQ", "COIN", "HOOD", "RBLX", "U", "PATH", "S", "ZM",
     "DOCU", "TWLO", "PTON", "ROKU", "PINS", "LYFT", "UBER", "DASH", "ABNB", "RIVN",
-]
+)
 
 
 class IntradayProgress:
@@ -144,18 +168,98 @@ class IntradayProgress:
         }
 
     def save_checkpoint(self, filename: str = "seed_intraday_checkpoint.json"):
-        """Save progress checkpoint for restart capability."""
+        """
+        Save progress checkpoint for restart capability.
+
+        Only the latest error per ticker is kept, and the file is written compact
+        so the C encoder handles it in one pass.
+        """
         checkpoint = {
             "progress": self.to_dict(),
-            "errors": self.errors,
+            "errors": list({error["ticker"]: error for error in self.errors}.values()),
             "last_processed_ticker_index": self.processed_tickers - 1,
             "timestamp": datetime.now(UTC).isoformat(),
         }
         with open(filename, "w") as f:
-            json.dump(checkpoint, f, indent=2)
+            f.write(json.dumps(checkpoint))
         logger.info(f"Checkpoint saved to {filename}")
 
 
+class CachedOHLCVProvider:
+    """
+    Wrap a provider's fetch_ohlcv with an on-disk cache of per-ticker frames.
+
+    Entries are keyed by (ticker, start date, end date, interval) and expire after
+    ttl, so restarting an interrupted run reuses what was already downloaded.
+    Expired entries are deleted when the cache is opened and whenever they are
+    read, so the file only holds recent responses.
+    """
+
+    def __init__(self, provider: Any, path: str, ttl: timedelta = timedelta(hours=24)):
+        self.provider = provider
+        self.source_name = provider.source_name
+        self.path = path
+        self.ttl = ttl
+        # shelve is not thread-safe and fetches run on worker threads
+        self._lock = threading.Lock()
+        self.purge_expired()
+
+    def purge_expired(self) -> int:
+        """Delete every expired entry and return how many were removed."""
+        now = datetime.now(UTC)
+        with self._lock, shelve.open(self.path) as cache:
+            expired = [key for key in cache if now - cache[key][0] >= self.ttl]
+            for key in expired:
+                del cache[key]
+        return len(expired)
+
+    @staticmethod
+    def _key(ticker: str, start_date: datetime, end_date: datetime, interval: str) -> str:
+        return f"{ticker}|{start_date.date()}|{end_date.date()}|{interval}"
+
+    def fetch_ohlcv(
+        self,
+        tickers: list[str],
+        start_date: datetime,
+        end_date: datetime,
+        interval: str = "1d",
+    ) -> dict[str, pd.DataFrame]:
+        """Return cached frames and fetch only the missing tickers in one provider call."""
+        now = datetime.now(UTC)
+        data: dict[str, pd.DataFrame] = {}
+
+        with self._lock, shelve.open(self.path) as cache:
+            for ticker in tickers:
+                key = self._key(ticker, start_date, end_date, interval)
+                entry = cache.get(key)
+                if entry is None:
+                    continue
+                if now - entry[0] < self.ttl:
+                    data[ticker] = entry[1]
+                else:
+                    del cache[key]
+
+        missing = [ticker for ticker in tickers if ticker not in data]
+        if data:
+            logger.info(f"Using cached 15m data for {len(data)}/{len(tickers)} tickers")
+        if not missing:
+            return data
+
+        fetched = self.provider.fetch_ohlcv(
+            tickers=missing,
+            start_date=start_date,
+            end_date=end_date,
+            interval=interval,
+        )
+        with self._lock, shelve.open(self.path) as cache:
+            for ticker, df in fetched.items():
+                if not df.empty:
+                    cache[self._key(ticker, start_date, end_date, interval)] = (now, df)
+
+        data.update(fetched)
+        return data
+
+
 def get_or_create_instrument(session: Session, symbol: str, exchange: str = "NASDAQ") -> Instrument:
     """Get existing instrument or create new one."""
     statement = select(Instrument).where(
@@ -181,18 +285,93 @@ def get_or_create_instrument(session: Session, symbol: str, exchange: str = "NAS
     return instrument
 
 
+def load_or_create_instruments(
+    session: Session, symbols: list[str], exchange: str = "NASDAQ"
+) -> dict[str, Instrument]:
+    """
+    Resolve all symbols to instruments up front, creating the missing ones in bulk.
+
+    Returns:
+        Dict mapping symbol to its instrument
+    """
+    statement = select(Instrument).where(
+        Instrument.exchange == exchange, Instrument.symbol.in_(symbols)
+    )
+    by_symbol = {instrument.symbol: instrument for instrument in session.exec(statement).all()}
+
+    missing = [symbol for symbol in dict.fromkeys(symbols) if symbol not in by_symbol]
+    if missing:
+        session.execute(
+            insert(Instrument.__table__),
+            [
+                {
+                    "symbol": symbol,
+                    "exchange": exchange,
+                    "name": f"{symbol} Inc.",
+                    "is_active": True,
+                }
+                for symbol in missing
+            ],
+        )
+        session.commit()
+        # The commit expired the instruments loaded above, so reload every symbol
+        # rather than only the new ones to avoid one refresh per instrument later
+        by_symbol = {instrument.symbol: instrument for instrument in session.exec(statement).all()}
+        logger.info(f"Created {len(missing)} new instruments")
+
+    return by_symbol
+
+
 def check_existing_intraday_data(
     session: Session, instrument_id: Any, start_date: datetime, interval: str = "15m"
 ) -> int:
     """Check how many intraday price bars already exist for this instrument."""
     statement = (
-        select(PriceBar)
+        select(func.count(PriceBar.id))
         .where(PriceBar.instrument_id == instrument_id)
         .where(PriceBar.interval == interval)
         .where(PriceBar.ts >= start_date)
     )
-    existing_count = len(session.exec(statement).all())
-    return existing_count
+    return session.exec(statement).one()
+
+
+def to_epoch_ns(timestamps) -> np.ndarray:
+    """Convert timestamps (naive values are taken as UTC) to a sorted int64 epoch-ns array."""
+    index = pd.DatetimeIndex(list(timestamps))
+    if index.tz is not None:
+        index = index.tz_convert(UTC).tz_localize(None)
+    return np.unique(index.as_unit("ns").asi8)
+
+
+def load_existing_timestamps(
+    session: Session,
+    instrument_ids: list[Any],
+    start_date: datetime,
+    interval: str = "15m",
+) -> dict[Any, np.ndarray]:
+    """
+    Load the timestamps already stored since start_date for many instruments at once.
+
+    Returns:
+        Dict mapping instrument id to a sorted int64 array of its bar timestamps
+        in UTC epoch nanoseconds
+    """
+    if not instrument_ids:
+        return {}
+
+    statement = (
+        select(PriceBar.instrument_id, PriceBar.ts)
+        .where(PriceBar.instrument_id.in_(instrument_ids))
+        .where(PriceBar.interval == interval)
+        .where(PriceBar.ts >= start_date)
+    )
+    by_instrument: dict[Any, list[datetime]] = defaultdict(list)
+    for instrument_id, ts in session.execute(statement):
+        by_instrument[instrument_id].append(ts)
+    return {
+        instrument_id: to_epoch_ns(timestamps)
+        for instrument_id, timestamps in by_instrument.items()
+    }
 
 
 def insert_price_bars_bulk(
@@ -200,197 +379,399 @@ def insert_price_bars_bulk(
     instrument_id: Any,
     df: pd.DataFrame,
     interval: str = "15m",
+    existing_ns: np.ndarray | None = None,
 ) -> tuple[int, int]:
     """
     Bulk insert price bars from DataFrame.
 
+    Bars already stored are skipped, using existing_ns (UTC epoch nanoseconds)
+    when preloaded by load_existing_timestamps, or a query over the frame's
+    window otherwise.
+
     Returns:
         Tuple of (inserted_count, skipped_count)
     """
     if df.empty:
         return 0, 0
 
-    inserted = 0
-    skipped = 0
-
-    # Get existing timestamps to avoid duplicates
-    existing_statement = (
-        select(PriceBar.ts)
-        .where(PriceBar.instrument_id == instrument_id)
-        .where(PriceBar.interval == interval)
-    )
-    existing_timestamps = {ts for (ts,) in session.exec(existing_statement).all()}
-
-    # Prepare batch of price bars
-    price_bars = []
-    for timestamp, row in df.iterrows():
-        # Convert pandas Timestamp to datetime
-        ts = timestamp.to_pydatetime()
-        if ts.tzinfo is None:
-            ts = ts.replace(tzinfo=UTC)
-
-        # Skip if already exists
-        if ts in existing_timestamps:
-            skipped += 1
-            continue
+    # Normalize the whole index to UTC in one vectorized pass
+    index = df.index.tz_localize(UTC) if df.index.tz is None else df.index.tz_convert(UTC)
 
-        price_bar = PriceBar(
-            instrument_id=instrument_id,
-            ts=ts,
-            o=float(row["Open"]),
-            h=float(row["High"]),
-            l=float(row["Low"]),
-            c=float(row["Close"]),
-            v=float(row["Volume"]),
-            interval=interval,
+    if existing_ns is None:
+        # Get existing timestamps to avoid duplicates, limited to the fetched window
+        existing_statement = (
+            select(PriceBar.ts)
+            .where(PriceBar.instrument_id == instrument_id)
+            .where(PriceBar.interval == interval)
+            .where(PriceBar.ts.between(index.min().to_pydatetime(), index.max().to_pydatetime()))
         )
-        price_bars.append(price_bar)
-        inserted += 1
+        existing_ns = to_epoch_ns(session.execute(existing_statement).scalars())
 
-    # Bulk insert
-    if price_bars:
-        session.add_all(price_bars)
-        session.commit()
+    # Skip timestamps that already exist, compared as int64 epoch nanoseconds
+    mask = ~np.isin(index.as_unit("ns").asi8, existing_ns)
+    skipped = len(df) - int(mask.sum())
+
+    if not mask.any():
+        return 0, skipped
+
+    # COPY the new bars through the shared staging loader; the unique
+    # (instrument_id, ts, interval) index drops any bar inserted concurrently since
+    # the existence check
+    counts = copy_price_bars_batch(session, {instrument_id: df[mask]}, interval)
+    inserted, conflicts = counts[instrument_id]
+    skipped += conflicts
+    session.commit()
 
     return inserted, skipped
 
 
-def seed_ticker_intraday(
+def record_ticker_error(
+    progress: IntradayProgress, ticker: str, error_msg: str, stage: str = "fetch"
+):
+    """Log a ticker that failed at the given stage (fetch or insert) and track quota errors."""
+    logger.error(
+        f"Failed to {stage} data for {ticker}: {error_msg}",
+        extra={
+            "ticker": ticker,
+            "interval": "15m",
+            "stage": stage,
+            "error": error_msg,
+        },
+    )
+
+    # Track quota-related errors
+    if "quota" in error_msg.lower() or "rate limit" in error_msg.lower():
+        progress.quota_warnings += 1
+        logger.warning(
+            "Quota/rate limit warning detected",
+            extra={"ticker": ticker, "quota_warnings": progress.quota_warnings},
+        )
+
+    progress.errors.append(
+        {
+            "ticker": ticker,
+            "error": error_msg,
+            "stage": stage,
+            "timestamp": datetime.now(UTC).isoformat(),
+            "interval": "15m",
+        }
+    )
+
+
+def prepare_chunk_intraday(
     session: Session,
-    ticker: str,
+    tickers: list[str],
     start_date: datetime,
-    end_date: datetime,
-    provider: Any,
     progress: IntradayProgress,
+    results: dict[str, bool],
+    instrument_cache: dict[str, Instrument],
     dry_run: bool = False,
-) -> bool:
+) -> dict[str, Instrument]:
     """
-    Seed intraday 15m price data for a single ticker.
+    Resolve instruments for a chunk and drop tickers that already have enough bars.
+
+    Tickers settled here (dry run, skipped, or failed) are recorded in results.
 
     Returns:
-        True if successful, False otherwise
+        Dict mapping the tickers still to fetch to their instruments
     """
-    try:
-        logger.info(
+    instruments: dict[str, Instrument] = {}
+
+    for ticker in tickers:
+        logger.debug(
             f"Processing ticker: {ticker}",
             extra={"ticker": ticker, "interval": "15m"},
         )
 
         if dry_run:
             logger.info(f"DRY RUN: Would fetch 15m data for {ticker}")
-            return True
-
-        # Get or create instrument
-        instrument = get_or_create_instrument(session, ticker)
-
-        # Check existing data
-        existing_count = check_existing_intraday_data(session, instrument.id, start_date, "15m")
-        
-        # Expected: ~26 bars per day (6.5 hours * 4 bars/hour) * 30 days = ~780 bars
-        expected_bars = 26 * 30
-        
-        if existing_count >= expected_bars * 0.90:
-            logger.info(
-                f"Ticker {ticker} already has sufficient intraday data ({existing_count} bars), skipping",
-                extra={
-                    "ticker": ticker,
-                    "existing_bars": existing_count,
-                    "expected_bars": expected_bars,
-                },
-            )
-            progress.total_bars_skipped += existing_count
-            return True
+            results[ticker] = True
+            continue
 
-        # Fetch data from provider
         try:
-            logger.info(
-                f"Fetching 15m data for {ticker}...",
-                extra={
-                    "ticker": ticker,
-                    "start_date": start_date.isoformat(),
-                    "end_date": end_date.isoformat(),
-                },
+            # Get or create instrument, preferring the preloaded cache
+            instrument = instrument_cache.get(ticker) or get_or_create_instrument(
+                session, ticker
             )
-            
-            data = provider.fetch_ohlcv(
-                tickers=[ticker],
-                start_date=start_date,
-                end_date=end_date,
-                interval="15m",
+
+            # Check existing data
+            existing_count = check_existing_intraday_data(
+                session, instrument.id, start_date, "15m"
+            )
+
+            # Expected: ~26 bars per day (6.5 hours * 4 bars/hour) * 30 days = ~780 bars
+            expected_bars = 26 * 30
+
+            if existing_count >= expected_bars * 0.90:
+                logger.debug(
+                    f"Ticker {ticker} already has sufficient intraday data "
+                    f"({existing_count} bars), skipping",
+                    extra={
+                        "ticker": ticker,
+                        "existing_bars": existing_count,
+                        "expected_bars": expected_bars,
+                    },
+                )
+                progress.total_bars_skipped += existing_count
+                results[ticker] = True
+                continue
+
+            instruments[ticker] = instrument
+
+        except Exception as e:
+            logger.error(
+                f"Unexpected error processing {ticker}: {e}",
+                exc_info=True,
+                extra={"ticker": ticker},
+            )
+            progress.errors.append(
+                {
+                    "ticker": ticker,
+                    "error": str(e),
+                    "timestamp": datetime.now(UTC).isoformat(),
+                    "interval": "15m",
+                }
             )
+            results[ticker] = False
+
+    return instruments
+
+
+# Per-thread database state for the insert workers
+_worker = threading.local()
+
+
+def open_worker_session(sessions: list[Session]):
+    """
+    Executor initializer giving each insert worker thread a Session of its own.
+
+    The Session is bound to a dedicated connection that stays open for the whole
+    run, so the connection and its COPY staging table are reused across tickers.
+    """
+    _worker.session = Session(bind=engine.connect())
+    sessions.append(_worker.session)
+
+
+def close_worker_sessions(sessions: list[Session]):
+    """Close the worker Sessions and the connections they are bound to."""
+    for session in sessions:
+        session.close()
+        session.bind.close()
+
+
+def insert_ticker_bars(
+    instrument_id: Any, df: pd.DataFrame, existing_ns: np.ndarray
+) -> tuple[int, int]:
+    """Insert one ticker's bars with the worker thread's Session."""
+    session = _worker.session
+    try:
+        return insert_price_bars_bulk(session, instrument_id, df, "15m", existing_ns)
+    except Exception:
+        # Leave the Session usable for the thread's next ticker
+        session.rollback()
+        raise
+
+
+async def persist_chunk_intraday(
+    executor: ThreadPoolExecutor,
+    instruments: dict[str, Instrument],
+    data: dict[str, pd.DataFrame] | BaseException,
+    existing: dict[Any, np.ndarray],
+    progress: IntradayProgress,
+    results: dict[str, bool],
+):
+    """
+    Insert the DataFrames returned for a chunk, one ticker per worker thread.
+
+    Bars whose timestamps are in the preloaded existing arrays are skipped. A
+    failed provider request (passed as the exception) fails every ticker it
+    covered. Counters are only updated here, on the event loop thread, once each
+    insert completes.
+    """
+    loop = asyncio.get_running_loop()
+    inserts: dict[str, asyncio.Future] = {}
+
+    for ticker, instrument in instruments.items():
+        try:
+            if isinstance(data, BaseException):
+                raise data
 
-            if ticker not in data or data[ticker].empty:
+            df = data.get(ticker)
+            if df is None or df.empty:
                 logger.warning(
                     f"No data returned for {ticker}",
                     extra={"ticker": ticker, "interval": "15m"},
                 )
                 raise ValueError(f"No data returned for {ticker}")
 
-            df = data[ticker]
+            inserts[ticker] = loop.run_in_executor(
+                executor,
+                insert_ticker_bars,
+                instrument.id,
+                df,
+                existing.get(instrument.id, NO_EXISTING_BARS),
+            )
+
+        except Exception as e:
+            record_ticker_error(progress, ticker, str(e))
+            results[ticker] = False
 
-            # Insert price bars
-            inserted, skipped = insert_price_bars_bulk(session, instrument.id, df, "15m")
+    for ticker, future in inserts.items():
+        try:
+            inserted, skipped = await future
+            total_rows = len(data[ticker])
 
-            logger.info(
-                f"Completed {ticker}: inserted={inserted}, skipped={skipped}, total_rows={len(df)}",
+            logger.debug(
+                f"Completed {ticker}: inserted={inserted}, skipped={skipped}, "
+                f"total_rows={total_rows}",
                 extra={
                     "ticker": ticker,
                     "interval": "15m",
                     "inserted": inserted,
                     "skipped": skipped,
-                    "total_rows": len(df),
+                    "total_rows": total_rows,
                 },
             )
 
             progress.total_bars_inserted += inserted
             progress.total_bars_skipped += skipped
-
-            return True
+            results[ticker] = True
 
         except Exception as e:
-            error_msg = str(e)
-            logger.error(
-                f"Failed to fetch data for {ticker}: {error_msg}",
-                extra={
-                    "ticker": ticker,
-                    "interval": "15m",
-                    "error": error_msg,
-                },
-            )
-            
-            # Track quota-related errors
-            if "quota" in error_msg.lower() or "rate limit" in error_msg.lower():
-                progress.quota_warnings += 1
-                logger.warning(
-                    "Quota/rate limit warning detected",
-                    extra={"ticker": ticker, "quota_warnings": progress.quota_warnings},
-                )
-            
-            progress.errors.append(
-                {
-                    "ticker": ticker,
-                    "error": error_msg,
-                    "timestamp": datetime.now(UTC).isoformat(),
-                    "interval": "15m",
-                }
-            )
-            return False
+            record_ticker_error(progress, ticker, str(e), stage="insert")
+            results[ticker] = False
+
+
+async def fetch_chunk_async(
+    provider: Any,
+    tickers: list[str],
+    start_date: datetime,
+    end_date: datetime,
+    semaphore: asyncio.Semaphore,
+    delay: float = 0.0,
+) -> dict[str, pd.DataFrame]:
+    """Fetch one chunk on a worker thread once its start delay and a slot allow."""
+    await asyncio.sleep(delay)
+    async with semaphore:
+        logger.info(
+            f"Fetching 15m data for {len(tickers)} tickers...",
+            extra={
+                "tickers": tickers,
+                "start_date": start_date.isoformat(),
+                "end_date": end_date.isoformat(),
+            },
+        )
+        return await asyncio.to_thread(
+            provider.fetch_ohlcv,
+            tickers=tickers,
+            start_date=start_date,
+            end_date=end_date,
+            interval="15m",
+        )
+
 
-    except Exception as e:
-        logger.error(
-            f"Unexpected error processing {ticker}: {e}",
-            exc_info=True,
-            extra={"ticker": ticker},
+async def seed_intraday_async(
+    session: Session,
+    batches: list[list[str]],
+    start_date: datetime,
+    end_date: datetime,
+    provider: Any,
+    progress: IntradayProgress,
+    max_workers: int = 8,
+    batch_delay: float = 0.0,
+    db_workers: int = 4,
+    dry_run: bool = False,
+) -> list[bool]:
+    """
+    Seed intraday 15m price data for all batches, fetching batches concurrently.
+
+    Every batch is fetched on a worker thread, at most max_workers at a time, with
+    starts at least batch_delay seconds apart; the provider paces its requests.
+    Instrument lookups use the given Session on the event loop thread, while each
+    batch's inserts fan out over db_workers threads, each with one Session for the run.
+    Batches are persisted in input order so checkpoints remain resumable.
+
+    Returns:
+        List of success flags, one per ticker in input order
+    """
+    semaphore = asyncio.Semaphore(max_workers)
+    results: dict[str, bool] = {}
+
+    # Resolve instruments up front, then fan out one fetch per batch
+    instrument_cache = (
+        {}
+        if dry_run
+        else load_or_create_instruments(
+            session, [ticker for batch in batches for ticker in batch]
         )
-        progress.errors.append(
-            {
-                "ticker": ticker,
-                "error": str(e),
-                "timestamp": datetime.now(UTC).isoformat(),
-                "interval": "15m",
-            }
+    )
+    prepared = [
+        prepare_chunk_intraday(
+            session, batch, start_date, progress, results, instrument_cache, dry_run
         )
-        return False
+        for batch in batches
+    ]
+    # One grouped query for the existing bars of every instrument still to fetch
+    existing = load_existing_timestamps(
+        session,
+        [instrument.id for instruments in prepared for instrument in instruments.values()],
+        start_date,
+    )
+
+    tasks: list[asyncio.Task | None] = []
+    for instruments in prepared:
+        task = None
+        if instruments:
+            task = asyncio.create_task(
+                fetch_chunk_async(
+                    provider,
+                    list(instruments),
+                    start_date,
+                    end_date,
+                    semaphore,
+                    delay=sum(t is not None for t in tasks) * batch_delay,
+                )
+            )
+        tasks.append(task)
+
+    worker_sessions: list[Session] = []
+    executor = ThreadPoolExecutor(
+        max_workers=db_workers, initializer=open_worker_session, initargs=(worker_sessions,)
+    )
+    try:
+        for batch, instruments, task in zip(batches, prepared, tasks, strict=True):
+            if task is not None:
+                try:
+                    data = await task
+                except Exception as e:
+                    data = e
+                await persist_chunk_intraday(
+                    executor, instruments, data, existing, progress, results
+                )
+
+            for ticker in batch:
+                progress.processed_tickers += 1
+                if results[ticker]:
+                    progress.successful_tickers += 1
+                else:
+                    progress.failed_tickers += 1
+
+            # Log progress after each batch
+            logger.info("\n" + "=" * 80)
+            logger.info("PROGRESS UPDATE")
+            logger.info(json.dumps(progress.to_dict(), indent=2))
+            logger.info("=" * 80 + "\n")
+
+            # Save checkpoint
+            progress.save_checkpoint()
+
+            # Write the batch's buffered log records in one go
+            buffered_file_handler.flush()
+    finally:
+        executor.shutdown()
+        close_worker_sessions(worker_sessions)
+
+    return [results[ticker] for batch in batches for ticker in batch]
 
 
 def main():
@@ -413,20 +794,41 @@ def main():
     parser.add_argument(
         "--batch-size",
         type=int,
+        default=50,
+        help="Number of tickers fetched per batch (default: 50)",
+    )
+    parser.add_argument(
+        "--batch-delay",
+        type=int,
         default=10,
-        help="Number of tickers to process before pause (default: 10)",
+        help="Delay in seconds between the start of batch fetches (default: 10)",
     )
     parser.add_argument(
-        "--delay",
+        "--max-workers",
+        type=int,
+        default=8,
+        help="Maximum number of batches fetched concurrently (default: 8)",
+    )
+    parser.add_argument(
+        "--rate-limit",
         type=float,
         default=1.0,
-        help="Delay in seconds between tickers (default: 1.0)",
+        help="Maximum provider requests per second across all batches (default: 1.0)",
     )
     parser.add_argument(
-        "--batch-delay",
+        "--db-workers",
         type=int,
-        default=10,
-        help="Delay in seconds between batches (default: 10)",
+        default=4,
+        help="Maximum number of concurrent ticker inserts (default: 4)",
+    )
+    parser.add_argument(
+        "--cache-path",
+        type=str,
+        default=None,
+        help=(
+            "Opt-in on-disk cache of provider responses, kept 24h, for restarting an "
+            "interrupted run without re-downloading (default: disabled)"
+        ),
     )
     parser.add_argument(
         "--dry-run",
@@ -445,10 +847,10 @@ def main():
     # Initialize progress tracker
     progress = IntradayProgress()
     
-    # Limit tickers to max requested
-    tickers_to_use = TICKER_LIST[: args.max_tickers]
-    tickers_to_process = tickers_to_use[args.start_ticker :]
+    # Limit tickers to max requested, taking the window in a single pass
+    tickers_to_process = list(islice(TICKER_LIST, args.start_ticker, args.max_tickers))
     progress.total_tickers = len(tickers_to_process)
+    batch_size = args.batch_size
 
     # Date range (rolling J-30)
     end_date = datetime.now(UTC)
@@ -460,58 +862,43 @@ def main():
     logger.info(f"Total tickers to process: {progress.total_tickers}")
     logger.info(f"Max tickers limit: {args.max_tickers}")
     logger.info(f"Starting from ticker index: {args.start_ticker}")
-    logger.info(f"Batch size: {args.batch_size}")
-    logger.info(f"Delay between tickers: {args.delay}s")
-    logger.info(f"Delay between batches: {args.batch_delay}s")
+    logger.info(f"Batch size: {batch_size}")
+    logger.info(f"Delay between batch fetches: {args.batch_delay}s")
+    logger.info(f"Max concurrent batches: {args.max_workers}")
+    logger.info(f"Rate limit: {args.rate_limit} provider requests/s")
+    logger.info(f"Max concurrent inserts: {args.db_workers}")
     logger.info(f"Dry run: {args.dry_run}")
     logger.info("=" * 80)
 
     # Create data provider (only primary - Yahoo Finance)
     primary, _ = create_data_provider_with_fallback()
+    # Each batch is one Yahoo request, taking a slot from one limiter shared by all batches
+    primary = RateLimitedProvider(primary, RateLimiter(args.rate_limit))
     logger.info(f"Using provider: {primary.source_name}")
-
-    # Process tickers
+    if args.cache_path:
+        primary = CachedOHLCVProvider(primary, args.cache_path)
+        logger.info(f"Caching provider responses in: {args.cache_path}")
+
+    # Process tickers, fetching batches concurrently
+    batches = [
+        tickers_to_process[batch_start : batch_start + batch_size]
+        for batch_start in range(0, len(tickers_to_process), batch_size)
+    ]
     with Session(engine) as session:
-        for i, ticker in enumerate(tickers_to_process):
-            ticker_index = args.start_ticker + i
-            logger.info(f"\n{'=' * 60}")
-            logger.info(f"Ticker {ticker_index + 1}/{len(tickers_to_use)}: {ticker}")
-            logger.info(f"{'=' * 60}")
-
-            success = seed_ticker_intraday(
+        asyncio.run(
+            seed_intraday_async(
                 session=session,
-                ticker=ticker,
+                batches=batches,
                 start_date=start_date,
                 end_date=end_date,
                 provider=primary,
                 progress=progress,
+                max_workers=args.max_workers,
+                batch_delay=args.batch_delay,
+                db_workers=args.db_workers,
                 dry_run=args.dry_run,
             )
-
-            progress.processed_tickers += 1
-            if success:
-                progress.successful_tickers += 1
-            else:
-                progress.failed_tickers += 1
-
-            # Log progress periodically
-            if (i + 1) % args.batch_size == 0 or (i + 1) == len(tickers_to_process):
-                logger.info("\n" + "=" * 80)
-                logger.info("PROGRESS UPDATE")
-                logger.info(json.dumps(progress.to_dict(), indent=2))
-                logger.info("=" * 80 + "\n")
-
-                # Save checkpoint
-                progress.save_checkpoint()
-
-            # Rate limiting between tickers
-            if not args.dry_run and (i + 1) < len(tickers_to_process):
-                time.sleep(args.delay)
-
-            # Longer pause between batches
-            if (i + 1) % args.batch_size == 0 and (i + 1) < len(tickers_to_process):
-                logger.info(f"Batch completed. Pausing for {args.batch_delay} seconds...")
-                time.sleep(args.batch_delay)
+        )
 
     # Final summary
     logger.info("\n" + "=" * 80)
@@ -11,6 +11,7 @@ import sys
 from datetime import UTC, datetime
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
 # Add backend directory to path
@@ -23,6 +24,7 @@ from app.features import (
     validate_features,
 )
 from app.models import Instrument, PriceBar
+from sqlalchemy import func
 from sqlmodel import Session, select
 
 # Configure logging
@@ -37,6 +39,9 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Rows buffered per streamed partition when loading price bars
+FETCH_PARTITION_SIZE = 5000
+
 
 def fetch_price_data(session: Session, instrument_id, interval: str = "daily") -> pd.DataFrame:
     """
@@ -50,35 +55,45 @@ def fetch_price_data(session: Session, instrument_id, interval: str = "daily") -
     Returns:
         DataFrame with OHLCV data
     """
+    count_statement = (
+        select(func.count(PriceBar.id))
+        .where(PriceBar.instrument_id == instrument_id)
+        .where(PriceBar.interval == interval)
+    )
+    total = session.exec(count_statement).one()
+    
+    if not total:
+        return pd.DataFrame()
+    
+    # Select only the OHLCV columns so rows come back as plain tuples, not ORM objects
     statement = (
-        select(PriceBar)
+        select(PriceBar.ts, PriceBar.o, PriceBar.h, PriceBar.l, PriceBar.c, PriceBar.v)
         .where(PriceBar.instrument_id == instrument_id)
         .where(PriceBar.interval == interval)
         .order_by(PriceBar.ts)
+        .execution_options(yield_per=FETCH_PARTITION_SIZE)
     )
     
-    price_bars = session.exec(statement).all()
+    # Stream partitions into preallocated arrays so only one partition of rows
+    # is held in Python objects at a time
+    timestamps = np.empty(total, dtype="datetime64[us]")
+    values = np.empty((total, 5), dtype=float)
+    filled = 0
+    for partition in session.exec(statement).partitions():
+        rows = partition[: total - filled]
+        end = filled + len(rows)
+        timestamps[filled:end] = [row[0] for row in rows]
+        values[filled:end] = [row[1:] for row in rows]
+        filled = end
+        if filled == total:
+            break
     
-    if not price_bars:
-        return pd.DataFrame()
-    
-    # Convert to DataFrame
-    data = []
-    for bar in price_bars:
-        data.append({
-            "ts": bar.ts,
-            "o": bar.o,
-            "h": bar.h,
-            "l": bar.l,
-            "c": bar.c,
-            "v": bar.v,
-        })
-    
-    df = pd.DataFrame(data)
-    df.set_index("ts", inplace=True)
-    df.sort_index(inplace=True)
-    
-    return df
+    # Rows are already ordered by ts
+    return pd.DataFrame(
+        values[:filled],
+        index=pd.DatetimeIndex(timestamps[:filled], name="ts"),
+        columns=["o", "h", "l", "c", "v"],
+    )
 
 
 def test_features_for_ticker(session: Session, symbol: str, exchange: str = "NASDAQ") -> dict: